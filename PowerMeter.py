@@ -1,19 +1,22 @@
-import random
+import math
 import time
 import csv
 import os
-import json
-from typing import BinaryIO, Optional, List, Tuple
+import copy
+import gzip
+from typing import BinaryIO, Dict, Optional, List, Tuple
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import numpy as np
+import orjson
 import pyvisa
 from datetime import datetime
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from flask import Flask, jsonify, request
-from flask_cors import CORS
+# Matplotlib and the API server stack (flask, flask_cors, waitress, msgpack) are imported
+# where they are first used, so startup does not pay for features that are not enabled
 
 
 # Configuration management
@@ -44,7 +47,9 @@ DEFAULT_CONFIG = {
         "time_window_s": 60,  # 60 seconds
         "auto_scale": True,
         "y_min": 0,
-        "y_max": 1000
+        "y_max": 1000,
+        "renderer": "tk",  # "tk" (native canvas) or "matplotlib"
+        "decimation": "minmax"  # "minmax" (keeps spikes) or "lttb" (keeps trace shape)
     },
     "api_server": {
         "enabled": False,
@@ -53,12 +58,25 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Valid keys of each configuration section, used to filter the loaded file
+_DEFAULT_KEYS = {section: frozenset(defaults) for section, defaults in DEFAULT_CONFIG.items()}
+
+
+# Configuration loaded by load_config, reused for the rest of the session
+_config_cache = None
+
 
 def save_config(config):
     """Save configuration to JSON file."""
+    global _config_cache
+    _config_cache = config
+    config_path = get_config_path()
+    temp_path = config_path + ".tmp"
     try:
-        with open(get_config_path(), 'w') as f:
-            json.dump(config, f, indent=4)
+        # Write a temporary file and swap it in, so an interrupted save cannot truncate the config
+        with open(temp_path, 'wb') as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        os.replace(temp_path, config_path)
         return True
     except Exception as e:
         print(f"Error saving configuration: {e}")
@@ -67,29 +85,659 @@ def save_config(config):
 
 def load_config():
     """Load configuration from JSON file or return defaults if not found."""
+    global _config_cache
+    if _config_cache is None:
+        _config_cache = read_config_file()
+    return _config_cache
+
+
+def read_config_file():
+    """Parse the configuration file, filling in defaults for missing keys."""
     config_path = get_config_path()
     
     if not os.path.exists(config_path):
-        return DEFAULT_CONFIG.copy()
+        return copy.deepcopy(DEFAULT_CONFIG)
         
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        with open(config_path, 'rb') as f:
+            config = orjson.loads(f.read())
             
         # Ensure all required keys exist by merging with defaults
-        merged_config = DEFAULT_CONFIG.copy()
+        merged_config = copy.deepcopy(DEFAULT_CONFIG)
         
         # Update with loaded values (only for keys that exist in DEFAULT_CONFIG)
-        for section in DEFAULT_CONFIG:
-            if section in config:
-                for key in DEFAULT_CONFIG[section]:
-                    if key in config[section]:
-                        merged_config[section][key] = config[section][key]
+        for section, keys in _DEFAULT_KEYS.items():
+            loaded = config.get(section, {})
+            merged_config[section].update({key: loaded[key] for key in keys.intersection(loaded)})
                         
         return merged_config
     except Exception as e:
         print(f"Error loading configuration: {e}")
-        return DEFAULT_CONFIG.copy()
+        return copy.deepcopy(DEFAULT_CONFIG)
+
+
+# Fastest acquisition interval selectable in the GUI, used to size the sample buffer
+MIN_ACQUISITION_MS = 100
+
+# Interval at which the GUI drains samples produced by the acquisition thread
+QUEUE_POLL_MS = 50
+
+# Interval of the plot refresh loop; it only redraws when new samples arrived
+REDRAW_INTERVAL_MS = 200
+
+# Upper bound for a single VISA operation, so a stuck instrument cannot stall acquisition
+VISA_TIMEOUT_MS = 500
+VISA_CHUNK_SIZE = 4096
+# Consecutive read timeouts tolerated before the device is treated as disconnected
+MAX_READ_TIMEOUTS = 5
+# Channel 1 (forward) and channel 2 (reflected) power in one compound query; the reply is ';'-separated
+FETCH_POWER_QUERY = ":FETCh1:SCALar:POWer:AC?;:FETCh2:SCALar:POWer:AC?"
+# Puts both channels into continuous measurement mode
+INITIATE_CONTINUOUS = ":INITiate1:CONTinuous ON;:INITiate2:CONTinuous ON"
+# Device scans probe this many VISA resources concurrently, so an unresponsive
+# alias costs one timeout instead of delaying every resource after it
+MAX_PROBE_WORKERS = 8
+# Enumerating VISA resources can take seconds, so listings are reused for this long
+RESOURCE_CACHE_S = 2.0
+# *IDN? answers are reused for this long, so repeated scans do not reopen every instrument
+IDENTITY_CACHE_S = 5.0
+
+# Reconnect attempts after losing the device before falling back to simulation mode
+RECONNECT_INTERVAL_MS = 2000
+MAX_RECONNECT_ATTEMPTS = 5
+
+# Delay for coalescing configuration saves triggered by rapid GUI edits
+CONFIG_SAVE_DELAY_MS = 500
+
+# Worker threads of the API's WSGI server, so slow /api/history requests don't queue up status polls
+API_SERVER_THREADS = 8
+# Open /api/stream connections each hold a worker; the rest stay free for the REST routes
+MAX_STREAM_CLIENTS = API_SERVER_THREADS - 4
+# API bodies of these types are gzip-compressed for clients that accept it; level 1 already
+# shrinks the repetitive history JSON several times over at a fraction of the CPU of level 9
+COMPRESS_MIMETYPES = ('application/json', 'application/msgpack')
+COMPRESS_MIN_BYTES = 1024
+COMPRESS_LEVEL = 1
+
+# The API server loop checks for a stop request this often
+API_POLL_S = 0.5
+
+# Idle /api/stream connections get a comment line this often, so dropped clients are noticed
+STREAM_KEEPALIVE_S = 15.0
+
+# /api/status bodies are reused for this long; the fields change at most once per acquisition
+STATUS_CACHE_S = 0.2
+
+# /api/current body when no sample exists yet; only the leading timestamp is filled in per request
+EMPTY_CURRENT_TAIL = b',"forward_power":0.0,"reflected_power":0.0,"vswr":1.0}'
+
+# Spinbox edits are applied once they have been idle this long
+FREQUENCY_DEBOUNCE_MS = 300
+
+# How long transient messages stay in the status bar
+STATUS_MESSAGE_MS = 4000
+
+# Simulated readings are drawn from the RNG this many at a time
+SIMULATION_BATCH_SIZE = 256
+
+# Human-readable timestamp format used in CSV exports
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Most points handed to the plot per trace; longer windows are reduced to a min/max envelope
+MAX_PLOT_POINTS = 1000
+# With "lttb" decimation, windows of more than LTTB_MIN_SAMPLES samples are reduced to LTTB_POINTS
+LTTB_MIN_SAMPLES = 300
+LTTB_POINTS = 200
+# Auto-scaling tightens the view once the data would fit in this fraction of it
+AUTO_SCALE_SHRINK_RATIO = 0.5
+
+# Matplotlib trace markers are only drawn while a trace has at most this many points;
+# beyond that they cost more to rasterize than the line itself and merge into it anyway
+MARKER_MAX_POINTS = 50
+
+
+def json_response(payload, status: int = 200):
+    """JSON response serialized with orjson, which is much faster than jsonify for large histories.
+    
+    payload may also be bytes that were already serialized (e.g. a cached response body).
+    """
+    from flask import Response
+    if not isinstance(payload, bytes):
+        payload = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return Response(payload, status=status, mimetype='application/json')
+
+
+def vswr_array(forward: np.ndarray, reflected: np.ndarray) -> np.ndarray:
+    """VSWR = (1 + sqrt(Pr/Pf)) / (1 - sqrt(Pr/Pf)) per sample, computed in one vectorized pass.
+    
+    Negative reflected readings count by magnitude; samples without forward power or
+    with |Pr| >= Pf report 1.0, matching /api/current.
+    """
+    reflected = np.abs(reflected)
+    valid = (forward > 0) & (reflected < forward)
+    # Invalid samples keep a zero ratio, which evaluates to a VSWR of exactly 1.0
+    root = np.sqrt(np.divide(reflected, forward, out=np.zeros_like(forward), where=valid))
+    return (1 + root) / (1 - root)
+
+
+def vswr_scalar(forward: float, reflected: float) -> float:
+    """Single-sample VSWR with the same rules as vswr_array, without the NumPy call overhead"""
+    reflected = abs(reflected)
+    if not 0 <= reflected < forward:
+        return 1.0
+    root = math.sqrt(reflected / forward)
+    return (1 + root) / (1 - root)
+
+
+def history_records(timestamps, forward_powers, reflected_powers) -> List[bytes]:
+    """Serialize each sample as its /api/history JSON object"""
+    vswrs = vswr_array(np.asarray(forward_powers, dtype=np.float64), np.asarray(reflected_powers, dtype=np.float64))
+    dumps = orjson.dumps
+    return [
+        dumps({
+            'timestamp': ts,
+            'forward_power': fp,
+            'reflected_power': rp,
+            'vswr': vswr
+        })
+        for ts, fp, rp, vswr in zip(timestamps, forward_powers, reflected_powers, vswrs.tolist())
+    ]
+
+
+def minmax_decimate(timestamps: np.ndarray, *traces: np.ndarray, max_points: int = MAX_PLOT_POINTS):
+    """Reduce traces to a min/max envelope of at most max_points points.
+    
+    The samples are split into max_points // 2 bins and each bin contributes its
+    minimum and maximum, so spikes stay visible while the plot cost depends on the
+    point budget rather than on the number of buffered samples.
+    """
+    n = len(timestamps)
+    if n <= max_points:
+        return (timestamps,) + traces
+    edges = np.linspace(0, n, max_points // 2 + 1, dtype=int)
+    starts, ends = edges[:-1], edges[1:] - 1
+    decimated_timestamps = np.empty(2 * len(starts))
+    decimated_timestamps[0::2] = timestamps[starts]
+    decimated_timestamps[1::2] = timestamps[ends]
+    decimated = [decimated_timestamps]
+    for trace in traces:
+        envelope = np.empty(2 * len(starts))
+        envelope[0::2] = np.minimum.reduceat(trace, starts)
+        envelope[1::2] = np.maximum.reduceat(trace, starts)
+        decimated.append(envelope)
+    return tuple(decimated)
+
+
+def lttb_decimate(timestamps: np.ndarray, *traces: np.ndarray, max_points: int = LTTB_POINTS,
+                  min_samples: int = LTTB_MIN_SAMPLES):
+    """Reduce traces longer than min_samples to max_points samples with Largest-Triangle-Three-Buckets.
+    
+    The first trace drives the selection and the other traces are sampled at the
+    same indices, so forward and reflected power stay aligned in time. All buckets are
+    evaluated at once: the left triangle vertex is the previous bucket's average rather
+    than its selected sample, which removes the bucket-to-bucket dependency of classic LTTB.
+    """
+    n = len(timestamps)
+    if n <= max(min_samples, max_points) or max_points < 3 or not traces:
+        return (timestamps,) + traces
+    x, y = timestamps, traces[0]
+    # First and last samples are always kept; samples 1..n-2 are split into equal buckets
+    buckets = max_points - 2
+    edges = np.linspace(1, n - 1, buckets + 1).astype(int)
+    starts, counts = edges[:-1], np.diff(edges)
+    bucket_of = np.repeat(np.arange(buckets), counts)  # Bucket of every middle sample
+    average_x = np.add.reduceat(x[:n - 1], starts) / counts
+    average_y = np.add.reduceat(y[:n - 1], starts) / counts
+    # Triangle vertices either side of each bucket: the neighbouring bucket averages,
+    # or the fixed first/last sample at the ends
+    left_x = np.concatenate(([x[0]], average_x[:-1]))[bucket_of]
+    left_y = np.concatenate(([y[0]], average_y[:-1]))[bucket_of]
+    right_x = np.concatenate((average_x[1:], [x[-1]]))[bucket_of]
+    right_y = np.concatenate((average_y[1:], [y[-1]]))[bucket_of]
+    areas = np.abs((left_x - right_x) * (y[1:n - 1] - left_y) - (left_x - x[1:n - 1]) * (right_y - left_y))
+    # Per-bucket argmax: the first sample in each bucket that reaches the bucket's largest area
+    hits = np.flatnonzero(areas == np.maximum.reduceat(areas, starts - 1)[bucket_of])
+    _, first_hits = np.unique(bucket_of[hits], return_index=True)
+    indices = np.concatenate(([0], hits[first_hits] + 1, [n - 1]))
+    return (timestamps[indices],) + tuple(trace[indices] for trace in traces)
+
+
+DECIMATORS = {"minmax": minmax_decimate, "lttb": lttb_decimate}
+
+
+class PowerDataBuffer:
+    """Fixed-capacity ring buffer of (timestamp, forward_power, reflected_power) samples.
+    
+    Each quantity is stored in its own preallocated NumPy array; the oldest samples
+    are overwritten in place instead of reallocating a list on every acquisition.
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamps = np.empty(capacity, dtype=np.float64)
+        self.forward = np.empty(capacity, dtype=np.float64)
+        self.reflected = np.empty(capacity, dtype=np.float64)
+        # Export timestamp text is formatted once per sample rather than on every export
+        self.time_strings = np.empty(capacity, dtype=object)
+        # Each sample's /api/history JSON object is serialized once, when it is stored
+        self.records = np.empty(capacity, dtype=object)
+        # Reused by snapshot() so the GUI does not allocate new arrays on every redraw
+        self.scratch = np.empty((3, capacity), dtype=np.float64)
+        self.head = 0  # Index of the next write
+        self.count = 0
+        self.version = 0  # Bumped on every change, so readers can tell when cached results are stale
+        self.appended = 0  # Samples ever stored, never reset; /api/stream tracks its position with it
+        # The API server thread reads while the GUI thread writes
+        self.lock = threading.Lock()
+        self.sample_added = threading.Condition(self.lock)  # Notified whenever samples are stored
+    
+    def __len__(self):
+        return self.count
+    
+    def append(self, timestamp: float, forward_power: float, reflected_power: float, time_string: str,
+               record: bytes):
+        with self.lock:
+            index = self.head
+            self.timestamps[index] = timestamp
+            self.forward[index] = forward_power
+            self.reflected[index] = reflected_power
+            self.time_strings[index] = time_string
+            self.records[index] = record
+            self.head = (index + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+            self.version += 1
+            self.appended += 1
+            self.sample_added.notify_all()
+    
+    def extend(self, timestamps, forward_powers, reflected_powers, time_strings, records):
+        """Append a batch of samples with slice assignment, wrapping at the end of the arrays"""
+        n = added = len(timestamps)
+        if n > self.capacity:
+            # Only the newest samples fit
+            timestamps, forward_powers, reflected_powers, time_strings, records = (
+                values[-self.capacity:]
+                for values in (timestamps, forward_powers, reflected_powers, time_strings, records))
+            n = self.capacity
+        with self.lock:
+            start = self.head
+            first = min(n, self.capacity - start)  # Samples that fit before the wrap
+            for column, values in ((self.timestamps, timestamps), (self.forward, forward_powers),
+                                   (self.reflected, reflected_powers), (self.time_strings, time_strings),
+                                   (self.records, records)):
+                column[start:start + first] = values[:first]
+                column[:n - first] = values[first:]
+            self.head = (start + n) % self.capacity
+            self.count = min(self.count + n, self.capacity)
+            self.version += 1
+            self.appended += added
+            self.sample_added.notify_all()
+    
+    def discard_older_than(self, cutoff_time: float):
+        """Drop samples from the old end of the buffer with timestamp < cutoff_time"""
+        with self.lock:
+            count = self.count
+            while self.count and self.timestamps[(self.head - self.count) % self.capacity] < cutoff_time:
+                self.count -= 1
+            if self.count != count:
+                self.version += 1
+    
+    def clear(self):
+        with self.lock:
+            self.head = 0
+            self.count = 0
+            self.version += 1
+    
+    def latest(self) -> Tuple[float, float, float]:
+        with self.lock:
+            index = (self.head - 1) % self.capacity
+            return (float(self.timestamps[index]), float(self.forward[index]), float(self.reflected[index]))
+    
+    def ordered(self, columns, n: int) -> tuple:
+        """Return copies of the newest n entries of each column in chronological order"""
+        with self.lock:
+            n = max(0, min(n, self.count))
+            start = (self.head - n) % self.capacity
+            if start + n <= self.capacity:
+                return tuple(column[start:start + n].copy() for column in columns)
+            return tuple(np.concatenate((column[start:], column[:self.head])) for column in columns)
+    
+    def last(self, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the newest n (timestamps, forward, reflected) samples in chronological order"""
+        return self.ordered((self.timestamps, self.forward, self.reflected), n)
+    
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return all buffered samples in chronological order"""
+        return self.last(self.count)
+    
+    def snapshot(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return all samples in chronological order as views of the scratch array.
+        
+        The views are overwritten by the next call, so only the GUI thread uses this
+        and consumers must copy anything they keep.
+        """
+        with self.lock:
+            n = self.count
+            start = (self.head - n) % self.capacity
+            first = min(n, self.capacity - start)  # Samples before the wrap
+            for column, out in zip((self.timestamps, self.forward, self.reflected), self.scratch):
+                out[:first] = column[start:start + first]
+                out[first:n] = column[:n - first]
+            return tuple(out[:n] for out in self.scratch)
+    
+    def history_json(self, n: int) -> bytes:
+        """JSON array of the newest n samples' records, joined from their pre-serialized objects"""
+        records, = self.ordered((self.records,), n)
+        return b'[' + b','.join(records) + b']'
+    
+    def wait_for_records(self, seen: int, timeout: float) -> Tuple[int, List[bytes]]:
+        """Wait up to timeout for samples beyond the first seen ever appended.
+        
+        Returns the new appended total and the records of those samples still buffered,
+        oldest first.
+        """
+        with self.sample_added:
+            self.sample_added.wait_for(lambda: self.appended != seen, timeout)
+            n = min(self.appended - seen, self.count)
+            start = (self.head - n) % self.capacity
+            if start + n <= self.capacity:
+                records = self.records[start:start + n].tolist()
+            else:
+                records = self.records[start:].tolist() + self.records[:self.head].tolist()
+            return self.appended, records
+    
+    def export_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return (time_strings, timestamps, forward, reflected) for all buffered samples"""
+        return self.ordered((self.time_strings, self.timestamps, self.forward, self.reflected), self.count)
+
+
+class TrendCanvas:
+    """Forward/reflected power trend drawn with native Tk canvas items.
+    
+    All items are created once; updates only move their coordinates, which is much
+    cheaper than rasterizing a Matplotlib figure for a two-trace line chart.
+    """
+    
+    MARGIN_LEFT = 70
+    MARGIN_RIGHT = 20
+    MARGIN_TOP = 45
+    MARGIN_BOTTOM = 20
+    GRID_COLOR = '#e9ecef'
+    
+    # (label, line color, fill color - the line color at 10% over white)
+    TRACES = (
+        ('Forward Power', '#2c7be5', '#eaf2fc'),
+        ('Reflected Power', '#dc3545', '#fbebec'),
+    )
+    
+    def __init__(self, master):
+        self.canvas = tk.Canvas(master, bg='#ffffff', highlightthickness=0)
+        self.widget = self.canvas
+        self.width = 1
+        self.height = 1
+        self.ylim = (0, 1000)
+        self.nbins = 8
+        self.data = None  # (timestamps, forward, reflected) of the last update
+        
+        self.canvas.create_text(0, 0, tags='title', text='Real-Time Power Measurement - Keysight N1914A',
+                                font=('Helvetica', 12, 'bold'), fill='#343a40')
+        self.canvas.create_text(0, 0, tags='ylabel', text='Watts (W)', angle=90,
+                                font=('Helvetica', 10), fill='#6c757d')
+        self.canvas.create_rectangle(0, 0, 0, 0, tags='frame', outline=self.GRID_COLOR)
+        self.fill_ids = [self.canvas.create_polygon(0, 0, 0, 0, 0, 0, fill=fill, outline='', state='hidden')
+                         for _, _, fill in self.TRACES]
+        self.line_ids = [self.canvas.create_line(0, 0, 0, 0, fill=color, width=2.5, state='hidden')
+                         for _, color, _ in self.TRACES]
+        self.traces_visible = False
+        self.canvas.create_rectangle(0, 0, 0, 0, tags=('legend', 'legend_box'), fill='#ffffff', outline='#cccccc')
+        for index, (label, color, _) in enumerate(self.TRACES):
+            self.canvas.create_line(0, 0, 0, 0, tags=('legend', f'legend_line{index}'), fill=color, width=2.5)
+            self.canvas.create_text(0, 0, tags=('legend', f'legend_text{index}'), text=label, anchor=tk.W,
+                                    font=('Helvetica', 9), fill='#343a40')
+        self.canvas.bind('<Configure>', self.on_resize)
+    
+    def plot_box(self) -> Tuple[int, int, int, int]:
+        return (self.MARGIN_LEFT, self.MARGIN_TOP,
+                max(self.width - self.MARGIN_RIGHT, self.MARGIN_LEFT + 1),
+                max(self.height - self.MARGIN_BOTTOM, self.MARGIN_TOP + 1))
+    
+    def on_resize(self, event):
+        self.width = event.width
+        self.height = event.height
+        self.draw_static()
+        self.draw_data()
+    
+    def get_ylim(self) -> Tuple[float, float]:
+        return self.ylim
+    
+    def set_ylim(self, y_min: float, y_max: float, nbins: Optional[int] = None):
+        """Change the Y-axis range; only the grid and tick labels are rebuilt"""
+        nbins = nbins or self.nbins
+        if (y_min, y_max) == self.ylim and nbins == self.nbins:
+            return
+        self.ylim = (y_min, y_max)
+        self.nbins = nbins
+        self.draw_static()
+        self.draw_data()
+    
+    def set_data(self, timestamps: np.ndarray, forward_powers: np.ndarray, reflected_powers: np.ndarray):
+        self.data = (timestamps, forward_powers, reflected_powers)
+        self.draw_data()
+    
+    @staticmethod
+    def nice_ticks(y_min: float, y_max: float, nbins: int) -> np.ndarray:
+        """Round tick values splitting the range into at most nbins intervals, like MaxNLocator"""
+        raw_step = (y_max - y_min) / nbins
+        magnitude = 10 ** math.floor(math.log10(raw_step))
+        for factor in (1, 2, 2.5, 5, 10):
+            step = factor * magnitude
+            if step >= raw_step:
+                break
+        first = math.ceil(y_min / step) * step
+        return np.arange(first, y_max + step * 1e-9, step)
+    
+    def draw_static(self):
+        """Lay out the title, frame, grid and legend for the current size and Y range"""
+        left, top, right, bottom = self.plot_box()
+        self.canvas.coords('title', (left + right) / 2, top / 2)
+        self.canvas.coords('ylabel', 15, (top + bottom) / 2)
+        self.canvas.coords('frame', left, top, right, bottom)
+        
+        self.canvas.delete('grid')
+        y_min, y_max = self.ylim
+        y_scale = (bottom - top) / (y_max - y_min)
+        for tick in self.nice_ticks(y_min, y_max, self.nbins):
+            y = bottom - (tick - y_min) * y_scale
+            self.canvas.create_line(left, y, right, y, tags='grid', fill=self.GRID_COLOR, dash=(1, 3))
+            self.canvas.create_text(left - 6, y, tags='grid', text=f"{tick:g}", anchor=tk.E,
+                                    font=('Helvetica', 9), fill='#343a40')
+        # Above the opaque fills so they cannot hide the grid, but still below the trace lines
+        self.canvas.tag_raise('grid', self.fill_ids[-1])
+        
+        box_left = right - 130
+        self.canvas.coords('legend_box', box_left, top + 8, right - 8, top + 50)
+        for index in range(len(self.TRACES)):
+            y = top + 19 + index * 20
+            self.canvas.coords(f'legend_line{index}', box_left + 8, y, box_left + 28, y)
+            self.canvas.coords(f'legend_text{index}', box_left + 34, y)
+        self.canvas.tag_raise('legend')
+    
+    def draw_data(self):
+        """Move the trace and fill items to the pixel positions of the current data"""
+        if self.data is None or len(self.data[0]) == 0:
+            return
+        timestamps, *traces = self.data
+        left, top, right, bottom = self.plot_box()
+        span = timestamps[-1] - timestamps[0] or 1.0
+        x = left + (timestamps - timestamps[0]) * ((right - left) / span)
+        y_min, y_max = self.ylim
+        y_scale = (bottom - top) / (y_max - y_min)
+        for trace, line_id, fill_id in zip(traces, self.line_ids, self.fill_ids):
+            y = np.clip(bottom - (trace - y_min) * y_scale, top, bottom)
+            points = np.column_stack((x, y)).ravel().tolist()
+            if len(points) == 2:
+                points *= 2  # A line needs at least two points
+            self.canvas.coords(line_id, points)
+            self.canvas.coords(fill_id, [points[0], bottom] + points + [points[-2], bottom])
+        if not self.traces_visible:
+            # Trace items start hidden so nothing is drawn before the first sample
+            for item_id in self.line_ids + self.fill_ids:
+                self.canvas.itemconfigure(item_id, state='normal')
+            self.traces_visible = True
+
+
+class MatplotlibTrendPlot:
+    """Forward/reflected power trend drawn as a Matplotlib figure.
+    
+    Offers the same interface as TrendCanvas. The data artists are animated and
+    blitted over a cached background, so only Y-limit changes redraw the figure.
+    """
+    
+    def __init__(self, master):
+        # Only imported when this renderer is selected
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        plt.style.use('seaborn-v0_8-whitegrid')
+        
+        self.figure = plt.Figure(figsize=(8, 5), dpi=100, facecolor='none')
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_facecolor('#ffffff')
+        self.figure.patch.set_alpha(0)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=master)
+        self.widget = self.canvas.get_tk_widget()
+        
+        self.ax.set_title('Real-Time Power Measurement - Keysight N1914A',
+                          fontsize=12,
+                          fontweight='bold',
+                          pad=15,
+                          color='#343a40')
+        self.ax.set_ylabel('Watts (W)',
+                           fontsize=10,
+                           labelpad=10,
+                           color='#6c757d')
+        self.ax.set_xticks([])
+        self.ax.set_xlabel('')
+        self.ax.grid(True, linestyle=':', alpha=0.6, color='#e9ecef')
+        for spine in ['top', 'right', 'left', 'bottom']:
+            self.ax.spines[spine].set_color('#e9ecef')
+        
+        # Data artists are animated: they are excluded from the full figure draw and
+        # repainted on top of the cached background (blitting) on every update
+        self.forward_line = self.ax.plot([], [],
+                                         color='#2c7be5',
+                                         linewidth=2.5,
+                                         alpha=0.8,
+                                         marker='o',
+                                         markersize=5,
+                                         markerfacecolor='#ffffff',
+                                         markeredgecolor='#2c7be5',
+                                         markeredgewidth=1.5,
+                                         zorder=3,
+                                         animated=True,
+                                         label='Forward Power')[0]
+        self.forward_fill = self.ax.fill_between([], [], color='#2c7be5', alpha=0.1, animated=True)
+        
+        self.reflected_line = self.ax.plot([], [],
+                                           color='#dc3545',
+                                           linewidth=2.5,
+                                           alpha=0.8,
+                                           marker='s',
+                                           markersize=5,
+                                           markerfacecolor='#ffffff',
+                                           markeredgecolor='#dc3545',
+                                           markeredgewidth=1.5,
+                                           zorder=3,
+                                           animated=True,
+                                           label='Reflected Power')[0]
+        self.reflected_fill = self.ax.fill_between([], [], color='#dc3545', alpha=0.1, animated=True)
+        
+        # Legend is drawn last so it stays on top of the traces
+        self.legend = self.ax.legend(loc='upper right', framealpha=0.9, fancybox=True, shadow=True)
+        self.legend.set_animated(True)
+        
+        self.plot_artists = [self.forward_fill, self.reflected_fill,
+                             self.forward_line, self.reflected_line, self.legend]
+        self.line_markers = ((self.forward_line, 'o'), (self.reflected_line, 's'))
+        self.markers_visible = True
+        self.plot_background = None
+        
+        self.nbins = None  # Tick count of the current locator; None keeps Matplotlib's default
+        self.ax.set_ylim(0, 1000)
+        self.figure.tight_layout()
+        self.tick_label_width = self.max_tick_label_width(0, 1000)
+        # Every full redraw (first show, resize, y-limit change) recaptures the background
+        self.canvas.mpl_connect('draw_event', self.on_plot_draw)
+
+    def on_plot_draw(self, event):
+        """Cache the static background after a full redraw and paint the data artists on it"""
+        self.plot_background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.draw_plot_artists()
+
+    def draw_plot_artists(self):
+        for artist in self.plot_artists:
+            self.ax.draw_artist(artist)
+
+    def blit_plot(self):
+        """Repaint only the data artists over the cached background"""
+        if self.plot_background is None:
+            # A full redraw is pending; it paints the data artists as well
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.plot_background)
+        self.draw_plot_artists()
+        self.canvas.blit(self.ax.bbox)
+
+    def get_ylim(self) -> Tuple[float, float]:
+        return tuple(self.ax.get_ylim())
+
+    def set_ylim(self, y_min: float, y_max: float, nbins: Optional[int] = None):
+        """Change the Y-axis limits and schedule the full redraw this requires"""
+        if (y_min, y_max) == self.get_ylim() and nbins in (None, self.nbins):
+            return
+        if nbins and nbins != self.nbins:
+            from matplotlib.ticker import MaxNLocator
+            self.nbins = nbins
+            self.ax.yaxis.set_major_locator(MaxNLocator(nbins))
+        self.ax.set_ylim(y_min, y_max)
+        # The layout only depends on the widest tick label, so skip the solver unless that changed
+        tick_label_width = self.max_tick_label_width(y_min, y_max)
+        if tick_label_width != self.tick_label_width:
+            self.tick_label_width = tick_label_width
+            self.figure.tight_layout()
+        # Tick labels change with the limits, so the background is stale
+        self.plot_background = None
+        self.canvas.draw_idle()
+
+    def max_tick_label_width(self, y_min, y_max) -> int:
+        ticks = self.ax.yaxis.get_major_locator().tick_values(y_min, y_max)
+        return max(len(f"{tick:g}") for tick in ticks)
+
+    def set_data(self, timestamps: np.ndarray, forward_powers: np.ndarray, reflected_powers: np.ndarray):
+        if len(timestamps) == 0:
+            return
+        self.forward_line.set_data(timestamps, forward_powers)
+        self.reflected_line.set_data(timestamps, reflected_powers)
+        self.forward_fill.set_verts([self.fill_vertices(timestamps, forward_powers)])
+        self.reflected_fill.set_verts([self.fill_vertices(timestamps, reflected_powers)])
+        markers_visible = len(timestamps) <= MARKER_MAX_POINTS
+        if markers_visible != self.markers_visible:
+            self.markers_visible = markers_visible
+            for line, marker in self.line_markers:
+                line.set_marker(marker if markers_visible else 'None')
+        if timestamps[-1] > timestamps[0]:
+            self.ax.set_xlim(timestamps[0], timestamps[-1])
+        else:
+            self.ax.set_xlim(timestamps[0] - 0.5, timestamps[0] + 0.5)
+        self.blit_plot()
+
+    @staticmethod
+    def fill_vertices(xs, ys):
+        """Closed polygon outline between a trace and the zero line"""
+        vertices = np.empty((len(xs) + 2, 2))
+        vertices[1:-1, 0] = xs
+        vertices[1:-1, 1] = ys
+        vertices[0] = (xs[0], 0)
+        vertices[-1] = (xs[-1], 0)
+        return vertices
 
 
 class PowerMonitor:
@@ -98,22 +746,61 @@ class PowerMonitor:
         
         # Load configuration
         self.config = load_config()
-        
-        # Data structure for both channels: (timestamp, forward_power, reflected_power)
-        self.data: List[Tuple[float, float, float]] = []
+        self.config_save_pending = False  # Set while a coalesced save is scheduled
+        self.config_writes = queue.SimpleQueue()  # Config snapshots for the writer thread, None to stop it
+        self.config_writer = None
+        self.frequency_update_id = None  # Pending debounced spinbox change
+        self.status_message_id = None  # Pending clear of the status bar message
+        self.config_window = None  # Configuration dialog, built on first open and hidden on close
+        self.refresh_config_dialog = None  # Reloads the dialog's fields from self.config
+        
+        # Sample window for both channels: (timestamp, forward_power, reflected_power)
+        self.time_window_s = self.config["display"]["time_window_s"]
+        self.data = PowerDataBuffer(int(self.time_window_s * 1000 / MIN_ACQUISITION_MS) + 1)
         self.device_connected = False
         self.simulation_mode = False
         self.n1914a = None
         self.rm = None
         self.monitoring = False
+        self.last_power: Optional[Tuple[float, float]] = None  # Last successful device reading
+        self.rng = np.random.default_rng()
+        self.simulated_readings: List[Tuple[float, float]] = []  # Pending batch for simulation mode
+        self.read_timeouts = 0
+        
+        # Set when the device stops responding; acquisition pauses (keeping the buffered
+        # data) while the acquisition thread retries the connection
+        self.reconnecting = False
+        self.reconnect_attempts = 0
+        self.reconnect_results = queue.SimpleQueue()  # True once reconnected, False after giving up
+        
+        # Acquisition thread state - instrument reads never run on the Tk main loop
+        self.sample_queue = queue.SimpleQueue()
+        self.acquisition_thread = None
+        self.stop_event = threading.Event()
+        self.visa_lock = threading.Lock()  # Serializes instrument I/O between threads
+        self.resources_cache: Tuple[str, ...] = ()
+        self.resources_time = None  # time.monotonic() of the cached listing
+        self.identity_cache: Dict[str, Tuple[float, Optional[str]]] = {}  # resource -> (time.monotonic(), *IDN?)
+        self.identity_lock = threading.Lock()  # identity_cache is shared by the Tk, acquisition and API threads
+        self.displayed_status = None
+        self.new_sample = False  # Set when samples arrive, cleared by the redraw loop
         
         # API Server state
         self.api_server = None
+        self.api_wsgi_server = None  # waitress server hosting api_server
+        self.api_stop_event = threading.Event()
         self.api_thread = None
         self.api_running = False
+        self.stream_slots = threading.BoundedSemaphore(MAX_STREAM_CLIENTS)  # Held by each open /api/stream
+        self.status_response = (None, b'')  # (time.monotonic() of the last build, body)
+        self.current_response = (None, b'')  # (data version the body was built from, body)
         
         # Initialize with loaded configuration
         self.acquisition_frequency_ms = int(self.config["display"]["update_frequency_Hz"] * 1000)  # Convert Hz to ms
+        # Redraw the plot only every disp_skip samples (about once per second by default);
+        # the numeric readouts still update on every sample
+        self.disp_skip = self.default_disp_skip()
+        self.samples_since_plot = 0
         
         # Initialize VISA resource manager
         try:
@@ -139,50 +826,68 @@ class PowerMonitor:
 
     def setup_api_server(self):
         """Setup Flask API server with routes"""
+        import msgpack
+        from flask import Flask, Response, request
+        from flask_cors import CORS
+        
         self.api_server = Flask(__name__)
         CORS(self.api_server)
+        # Data versions restart with the application, so ETags carry a per-server prefix
+        etag_prefix = f"{time.time_ns():x}-"
+        
+        @self.api_server.after_request
+        def compress_response(response):
+            if (response.direct_passthrough or response.is_streamed
+                    or response.mimetype not in COMPRESS_MIMETYPES
+                    or 'Content-Encoding' in response.headers):
+                return response
+            response.vary.add('Accept-Encoding')
+            body = response.get_data()
+            if len(body) < COMPRESS_MIN_BYTES or 'gzip' not in request.accept_encodings:
+                return response
+            response.set_data(gzip.compress(body, compresslevel=COMPRESS_LEVEL))
+            response.headers['Content-Encoding'] = 'gzip'
+            return response
         
         @self.api_server.route('/api/status', methods=['GET'])
         def get_status():
-            return jsonify({
-                'device_connected': self.device_connected,
-                'simulation_mode': self.simulation_mode,
-                'monitoring': self.monitoring,
-                'acquisition_frequency_ms': self.acquisition_frequency_ms,
-                'data_points': len(self.data)
-            })
+            built_at, body = self.status_response
+            now = time.monotonic()
+            if built_at is None or now - built_at > STATUS_CACHE_S:
+                body = orjson.dumps({
+                    'device_connected': self.device_connected,
+                    'simulation_mode': self.simulation_mode,
+                    'monitoring': self.monitoring,
+                    'acquisition_frequency_ms': self.acquisition_frequency_ms,
+                    'data_points': len(self.data)
+                })
+                self.status_response = (now, body)
+            return json_response(body)
         
         @self.api_server.route('/api/current', methods=['GET'])
         def get_current_power():
             if not self.data:
-                return jsonify({
-                    'timestamp': time.time(),
-                    'forward_power': 0.0,
-                    'reflected_power': 0.0,
-                    'vswr': 1.0
-                })
-            
-            timestamp, forward_power, reflected_power = self.data[-1]
+                return json_response(b'{"timestamp":' + orjson.dumps(time.time()) + EMPTY_CURRENT_TAIL)
             
-            # Calculate VSWR - handle negative reflected power by using absolute value
-            reflected_power_abs = abs(reflected_power)
-            if forward_power > 0 and reflected_power_abs < forward_power:
-                # VSWR = (1 + sqrt(Pr/Pf)) / (1 - sqrt(Pr/Pf))
-                # where Pr = reflected power, Pf = forward power
-                ratio = reflected_power_abs / forward_power
-                if ratio < 1:  # Valid case
-                    vswr = (1 + ratio**0.5) / (1 - ratio**0.5)
-                else:
-                    vswr = float('inf')  # Invalid case
-            else:
-                vswr = 1.0  # Perfect match or no forward power
+            # Clients may poll faster than samples arrive; reuse the body until the data changes
+            version, body = self.current_response
+            if version != self.data.version:
+                version = self.data.version
+                timestamp, forward_power, reflected_power = self.data.latest()
+                
+                body = orjson.dumps({
+                    'timestamp': timestamp,
+                    'forward_power': forward_power,
+                    'reflected_power': reflected_power,
+                    'vswr': vswr_scalar(forward_power, reflected_power)
+                })
+                self.current_response = (version, body)
             
-            return jsonify({
-                'timestamp': timestamp,
-                'forward_power': forward_power,
-                'reflected_power': reflected_power,
-                'vswr': vswr
-            })
+            # The data version identifies the body, so a poller sending it back in If-None-Match
+            # gets an empty 304 until a new sample arrives
+            response = json_response(body)
+            response.set_etag(f"{etag_prefix}{version}")
+            return response.make_conditional(request)
         
         @self.api_server.route('/api/history', methods=['GET'])
         def get_power_history():
@@ -190,65 +895,76 @@ class PowerMonitor:
             limit = min(limit, len(self.data))
             
             if limit <= 0:
-                return jsonify([])
+                return json_response([])
             
-            recent_data = self.data[-limit:]
-            history = []
+            # Clients that ask for msgpack get the raw arrays, with no per-value encoding at all
+            if request.accept_mimetypes.best_match(['application/json', 'application/msgpack']) == 'application/msgpack':
+                timestamps, forward_powers, reflected_powers = self.data.last(limit)
+                payload = msgpack.packb({
+                    'dtype': '<f8',
+                    'count': len(timestamps),
+                    'timestamp': timestamps.astype('<f8').tobytes(),
+                    'forward_power': forward_powers.astype('<f8').tobytes(),
+                    'reflected_power': reflected_powers.astype('<f8').tobytes(),
+                    'vswr': vswr_array(forward_powers, reflected_powers).astype('<f8').tobytes()
+                }, use_bin_type=True)
+                return Response(payload, mimetype='application/msgpack')
             
-            for ts, fp, rp in recent_data:
-                # Calculate VSWR for each data point
-                reflected_power_abs = abs(rp)
-                if fp > 0 and reflected_power_abs < fp:
-                    ratio = reflected_power_abs / fp
-                    if ratio < 1:
-                        vswr = (1 + ratio**0.5) / (1 - ratio**0.5)
-                    else:
-                        vswr = float('inf')
-                else:
-                    vswr = 1.0
-                
-                history.append({
-                    'timestamp': ts,
-                    'forward_power': fp,
-                    'reflected_power': rp,
-                    'vswr': vswr
-                })
+            # Samples were serialized as they were stored; only the array brackets are added here
+            return json_response(self.data.history_json(limit))
+        
+        @self.api_server.route('/api/stream', methods=['GET'])
+        def stream_power():
+            if not self.stream_slots.acquire(blocking=False):
+                return json_response({
+                    'success': False,
+                    'message': f'Too many open streams (at most {MAX_STREAM_CLIENTS}); poll /api/current instead'
+                }, status=503)
+            
+            # Start with the newest sample, then push each new one as the GUI thread stores it
+            seen = self.data.appended - min(1, len(self.data))
             
-            return jsonify(history)
+            def events():
+                nonlocal seen
+                idle_since = time.monotonic()
+                while not self.api_stop_event.is_set():
+                    seen, records = self.data.wait_for_records(seen, API_POLL_S)
+                    if records:
+                        idle_since = time.monotonic()
+                        yield b''.join(b'data: ' + record + b'\n\n' for record in records)
+                    elif time.monotonic() - idle_since > STREAM_KEEPALIVE_S:
+                        idle_since = time.monotonic()
+                        yield b': keepalive\n\n'
+            
+            # The slot is released when the server closes the response, even if the stream never started
+            response = Response(events(), mimetype='text/event-stream',
+                                headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+            response.call_on_close(self.stream_slots.release)
+            return response
         
         @self.api_server.route('/api/devices', methods=['GET'])
         def list_devices():
             try:
-                resources = self.rm.list_resources()
+                resources = self.list_resources()
                 devices = []
                 
-                for resource in resources:
-                    try:
-                        instrument = self.rm.open_resource(resource)
-                        identity = instrument.query("*IDN?").strip()
-                        instrument.close()
-                        devices.append({
-                            'resource': resource,
-                            'identity': identity,
-                            'is_n1914a': 'N1914A' in identity
-                        })
-                    except:
-                        devices.append({
-                            'resource': resource,
-                            'identity': 'Unknown/Error',
-                            'is_n1914a': False
-                        })
+                for resource, identity in zip(resources, self.identify_resources(resources)):
+                    devices.append({
+                        'resource': resource,
+                        'identity': identity if identity is not None else 'Unknown/Error',
+                        'is_n1914a': identity is not None and 'N1914A' in identity
+                    })
                 
-                return jsonify({
+                return json_response({
                     'success': True,
                     'devices': devices
                 })
                 
             except Exception as e:
-                return jsonify({
+                return json_response({
                     'success': False,
                     'message': f'Failed to list devices: {str(e)}'
-                }), 500
+                }, status=500)
 
     def start_api_server(self):
         """Start the API server in a separate thread"""
@@ -256,14 +972,19 @@ class PowerMonitor:
             return
         
         try:
+            from waitress import create_server
+            
             self.setup_api_server()
             host = self.config["api_server"]["host"]
             port = self.config["api_server"]["port"]
             
-            def run_server():
-                self.api_server.run(host=host, port=port, debug=False, use_reloader=False)
-            
-            self.api_thread = threading.Thread(target=run_server, daemon=True)
+            # Binding happens here, so a port already in use is reported right away
+            socket_map = {}
+            self.api_wsgi_server = create_server(self.api_server, map=socket_map, host=host, port=port,
+                                                 threads=API_SERVER_THREADS)
+            self.api_stop_event.clear()
+            self.api_thread = threading.Thread(target=self.run_api_server,
+                                               args=(self.api_wsgi_server, socket_map), daemon=True)
             self.api_thread.start()
             self.api_running = True
             
@@ -273,14 +994,27 @@ class PowerMonitor:
             print(f"Failed to start API server: {e}")
             messagebox.showerror("API Server Error", f"Failed to start API server: {str(e)}")
 
+    def run_api_server(self, server, socket_map):
+        """Serve API requests until stop_api_server() is called, then close all sockets"""
+        # The loop is driven here rather than by server.run(), so the sockets are closed
+        # on this thread instead of underneath a select() running on it
+        from waitress import wasyncore
+        
+        while not self.api_stop_event.is_set():
+            wasyncore.loop(timeout=API_POLL_S, map=socket_map, count=1)
+        wasyncore.close_all(socket_map)
+        server.task_dispatcher.shutdown()
+
     def stop_api_server(self):
         """Stop the API server"""
         if not self.api_running:
             return
         
         try:
-            # Flask doesn't have a clean shutdown method, so we'll just mark it as stopped
             self.api_running = False
+            self.api_stop_event.set()
+            self.api_thread.join(timeout=2.0)
+            self.api_wsgi_server = None
             self.api_server = None
             self.api_thread = None
             print("API Server stopped")
@@ -294,15 +1028,15 @@ class PowerMonitor:
             self.stop_api_server()
             self.config["api_server"]["enabled"] = False
             self.api_toggle_btn.config(text="Start API Server")
-            messagebox.showinfo("API Server", "API Server stopped")
+            self.flash_status("API Server stopped")
         else:
             self.start_api_server()
             if self.api_running:
                 self.config["api_server"]["enabled"] = True
                 self.api_toggle_btn.config(text="Stop API Server")
-                messagebox.showinfo("API Server", f"API Server started on port {self.config['api_server']['port']}")
+                self.flash_status(f"API Server started on port {self.config['api_server']['port']}")
         
-        save_config(self.config)
+        self.schedule_config_save()
 
     def initialize_continuous_measurement(self):
         """Initialize continuous measurement mode for both channels"""
@@ -310,13 +1044,98 @@ class PowerMonitor:
             return
         
         try:
-            # Set continuous measurement mode for both channels (only once during initialization)
-            self.n1914a.write(":INITiate1:CONTinuous ON")
-            self.n1914a.write(":INITiate2:CONTinuous ON")
+            # Set continuous measurement mode for both channels (only once per connection),
+            # so each sample is a plain FETCh? without re-arming the trigger
+            with self.visa_lock:
+                self.n1914a.write(INITIATE_CONTINUOUS)
             print("Continuous measurement mode initialized for both channels")
         except Exception as e:
             print(f"Error initializing continuous measurement: {e}")
 
+    def open_instrument(self, resource):
+        """Open a VISA resource with the bounded timeout used for all instrument I/O"""
+        instrument = self.rm.open_resource(resource, open_timeout=VISA_TIMEOUT_MS)
+        instrument.timeout = VISA_TIMEOUT_MS
+        instrument.chunk_size = VISA_CHUNK_SIZE
+        return instrument
+
+    def list_resources(self, refresh=False) -> Tuple[str, ...]:
+        """VISA resource names, re-enumerated only when refresh is set or the listing is older than RESOURCE_CACHE_S"""
+        now = time.monotonic()
+        if refresh or self.resources_time is None or now - self.resources_time > RESOURCE_CACHE_S:
+            self.resources_cache = tuple(self.rm.list_resources())
+            self.resources_time = now
+        return self.resources_cache
+
+    def identify_resources(self, resources) -> List[Optional[str]]:
+        """Query *IDN? on all resources in parallel; returns identities in resource order (None on error)
+        
+        Answers younger than IDENTITY_CACHE_S are reused instead of reopening the instrument.
+        """
+        def identify(resource):
+            instrument = self.open_instrument(resource)
+            try:
+                return instrument.query("*IDN?").strip()
+            finally:
+                instrument.close()
+        
+        now = time.monotonic()
+        with self.identity_lock:
+            # Expired entries are dropped, so resources that went away do not pile up
+            for resource in [resource for resource, entry in self.identity_cache.items()
+                             if now - entry[0] >= IDENTITY_CACHE_S]:
+                del self.identity_cache[resource]
+            cached = {resource: entry[1] for resource, entry in self.identity_cache.items()}
+        stale = [resource for resource in resources if resource not in cached]
+        if stale:
+            with ThreadPoolExecutor(max_workers=max(1, min(MAX_PROBE_WORKERS, len(stale)))) as pool:
+                for resource, future in [(resource, pool.submit(identify, resource)) for resource in stale]:
+                    try:
+                        identity = future.result()
+                    except Exception:
+                        identity = None
+                    cached[resource] = identity
+                    with self.identity_lock:
+                        self.identity_cache[resource] = (now, identity)
+        return [cached[resource] for resource in resources]
+
+    def clear_identity_cache(self):
+        """Forget probed identities; they no longer hold once the meter is open"""
+        with self.identity_lock:
+            self.identity_cache.clear()
+
+    def find_n1914a(self, resources):
+        """Probe resources in parallel and return (resource, open instrument) for the first N1914A, or None"""
+        def probe(resource):
+            instrument = self.open_instrument(resource)
+            try:
+                if "N1914A" in instrument.query("*IDN?"):
+                    return instrument
+            except Exception:
+                pass
+            instrument.close()
+            return None
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_PROBE_WORKERS, len(resources)))) as pool:
+            futures = [pool.submit(probe, resource) for resource in resources]
+            for future in as_completed(futures):
+                if future.exception() is None and future.result() is not None:
+                    # Found one - skip probes that have not started yet
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        
+        # Prefer the first match in resource order and close any other matches
+        found = None
+        for resource, future in zip(resources, futures):
+            if future.cancelled() or future.exception() is not None or future.result() is None:
+                continue
+            if found is None:
+                found = (resource, future.result())
+            else:
+                future.result().close()
+        return found
+
     def connect_to_device(self) -> bool:
         # Use connection string from config
         connection_string = self.config["device"]["connection_string"]
@@ -324,33 +1143,35 @@ class PowerMonitor:
         # If connection string is empty, try to detect device
         if not connection_string:
             try:
-                resources = self.rm.list_resources()
+                resources = self.list_resources()
                 if not resources:
                     return False
-                for resource in resources:
-                    try:
-                        instrument = self.rm.open_resource(resource)
-                        identity = instrument.query("*IDN?").strip()
-                        if "N1914A" in identity:
-                            self.n1914a = instrument
-                            self.device_connected = True
-                            # Save successful connection string
-                            self.config["device"]["connection_string"] = resource
-                            save_config(self.config)
-                            return True
-                        instrument.close()
-                    except:
-                        continue
-                return False
+                # The meter is normally on USB; only probe GPIB/TCPIP/serial aliases, whose
+                # discovery can be slow, when no USB resource answers as an N1914A
+                usb_resources = [resource for resource in resources if resource.startswith('USB')]
+                found = self.find_n1914a(usb_resources)
+                if found is None:
+                    found = self.find_n1914a([resource for resource in resources
+                                              if not resource.startswith('USB')])
+                if found is None:
+                    return False
+                resource, self.n1914a = found
+                self.device_connected = True
+                self.clear_identity_cache()
+                # Save successful connection string
+                self.config["device"]["connection_string"] = resource
+                self.schedule_config_save()
+                return True
             except Exception as e:
                 return False
         else:
             # Try to connect using saved connection string
             try:
-                self.n1914a = self.rm.open_resource(connection_string)
+                self.n1914a = self.open_instrument(connection_string)
                 identity = self.n1914a.query("*IDN?").strip()
                 if "N1914A" in identity:
                     self.device_connected = True
+                    self.clear_identity_cache()
                     return True
                 else:
                     self.n1914a.close()
@@ -392,10 +1213,19 @@ class PowerMonitor:
         self.freq_var = tk.StringVar(value=str(self.acquisition_frequency_ms))
         self.freq_spinbox = ttk.Spinbox(freq_frame, from_=100, to=10000, increment=100,
                                        textvariable=self.freq_var, width=10,
-                                       command=self.update_acquisition_frequency)
+                                       command=self.schedule_frequency_update)
         self.freq_spinbox.pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(freq_frame, text="Apply", command=self.update_acquisition_frequency).pack(side=tk.LEFT, padx=(0, 20))
         
+        # Plot decimation control
+        ttk.Label(freq_frame, text="Plot Every N Samples:").pack(side=tk.LEFT, padx=(0, 5))
+        self.disp_skip_var = tk.StringVar(value=str(self.disp_skip))
+        self.disp_skip_spinbox = ttk.Spinbox(freq_frame, from_=1, to=100, increment=1,
+                                            textvariable=self.disp_skip_var, width=5,
+                                            command=self.update_disp_skip)
+        self.disp_skip_spinbox.bind('<Return>', lambda event: self.update_disp_skip())
+        self.disp_skip_spinbox.pack(side=tk.LEFT, padx=(0, 20))
+        
         # Y-axis scaling control
         ttk.Label(freq_frame, text="Y-Axis Auto-Scale:").pack(side=tk.LEFT, padx=(0, 5))
         self.auto_scale_var = tk.BooleanVar(value=self.config["display"]["auto_scale"])
@@ -444,13 +1274,13 @@ class PowerMonitor:
         # Graph frame
         graph_frame = ttk.Frame(main_frame, style='Card.TFrame')
         graph_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
-        self.figure = plt.Figure(figsize=(8, 5), dpi=100, facecolor='none')
-        self.ax = self.figure.add_subplot(111)
-        plt.style.use('seaborn-v0_8-whitegrid')
-        self.ax.set_facecolor('#ffffff')
-        self.figure.patch.set_alpha(0)
-        self.canvas = FigureCanvasTkAgg(self.figure, master=graph_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.auto_ylim = None  # Limits last chosen by auto-scaling
+        self.manual_ylim_cache = (None, (0, 1000))  # ((y_min text, y_max text), parsed limits)
+        if self.config["display"]["renderer"] == "matplotlib":
+            self.trend_plot = MatplotlibTrendPlot(graph_frame)
+        else:
+            self.trend_plot = TrendCanvas(graph_frame)
+        self.trend_plot.widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         # Controls
         control_frame = ttk.Frame(main_frame)
@@ -470,17 +1300,47 @@ class PowerMonitor:
         self.connection_status.pack(side=tk.RIGHT, padx=(0, 10))
         self.connection_status_label = ttk.Label(self.statusbar, text="Connection Status:", font=('Helvetica', 10, 'bold'), foreground='black')
         self.connection_status_label.pack(side=tk.RIGHT, padx=(0, 2))
+        # Transient, non-blocking notifications on the left of the status bar
+        self.status_message_var = tk.StringVar(value="")
+        ttk.Label(self.statusbar, textvariable=self.status_message_var,
+                  font=('Helvetica', 10), foreground='#6c757d').pack(side=tk.LEFT, padx=(10, 0))
         self.update_status_display()
 
+    def flash_status(self, message):
+        """Show a message in the status bar without blocking, clearing it after STATUS_MESSAGE_MS"""
+        self.status_message_var.set(message)
+        if self.status_message_id is not None:
+            self.root.after_cancel(self.status_message_id)
+        self.status_message_id = self.root.after(STATUS_MESSAGE_MS, self.clear_status_message)
+
+    def clear_status_message(self):
+        self.status_message_id = None
+        self.status_message_var.set("")
+
+    def schedule_frequency_update(self):
+        """Apply spinbox changes once the user stops clicking, instead of on every step"""
+        if self.frequency_update_id is not None:
+            self.root.after_cancel(self.frequency_update_id)
+        self.frequency_update_id = self.root.after(FREQUENCY_DEBOUNCE_MS, self.update_acquisition_frequency)
+
     def update_acquisition_frequency(self):
+        if self.frequency_update_id is not None:
+            # Apply button pressed while a spinbox change was pending
+            self.root.after_cancel(self.frequency_update_id)
+            self.frequency_update_id = None
         try:
             new_freq = int(self.freq_var.get())
+            if new_freq == self.acquisition_frequency_ms:
+                return
             if 100 <= new_freq <= 10000:
                 self.acquisition_frequency_ms = new_freq
+                # Keep the plot refresh near 1 Hz at the new rate
+                self.disp_skip = self.default_disp_skip()
+                self.disp_skip_var.set(str(self.disp_skip))
                 # Update and save configuration
                 self.config["display"]["update_frequency_Hz"] = new_freq / 1000.0  # Convert ms to Hz
-                save_config(self.config)
-                messagebox.showinfo("Success", f"Acquisition frequency updated to {new_freq}ms")
+                self.schedule_config_save()
+                self.flash_status(f"Acquisition frequency updated to {new_freq}ms")
             else:
                 messagebox.showerror("Error", "Frequency must be between 100ms and 10000ms")
                 self.freq_var.set(str(self.acquisition_frequency_ms))
@@ -488,6 +1348,20 @@ class PowerMonitor:
             messagebox.showerror("Error", "Please enter a valid number")
             self.freq_var.set(str(self.acquisition_frequency_ms))
 
+    def default_disp_skip(self) -> int:
+        """Samples per plot refresh that keep the plot at about one redraw per second"""
+        return max(1, int(1000 / self.acquisition_frequency_ms))
+
+    def update_disp_skip(self):
+        try:
+            new_skip = int(self.disp_skip_var.get())
+            if new_skip >= 1:
+                self.disp_skip = new_skip
+                return
+        except ValueError:
+            pass
+        self.disp_skip_var.set(str(self.disp_skip))
+
     def toggle_auto_scale(self):
         """Toggle between auto-scaling and manual Y-axis control"""
         if self.auto_scale_var.get():
@@ -499,8 +1373,10 @@ class PowerMonitor:
         
         # Save setting to configuration
         self.config["display"]["auto_scale"] = self.auto_scale_var.get()
-        save_config(self.config)
+        self.schedule_config_save()
         
+        # Re-fit from scratch rather than keeping limits from before the switch
+        self.auto_ylim = None
         self.update_gui()
 
     def apply_manual_scale(self):
@@ -518,15 +1394,14 @@ class PowerMonitor:
                 return
             
             # Apply the manual range
-            self.ax.set_ylim(y_min, y_max)
-            self.canvas.draw()
+            self.trend_plot.set_ylim(y_min, y_max)
             
             # Save settings to configuration
             self.config["display"]["y_min"] = y_min
             self.config["display"]["y_max"] = y_max
-            save_config(self.config)
+            self.schedule_config_save()
             
-            messagebox.showinfo("Success", f"Y-axis range set to {y_min:.1f} - {y_max:.1f}")
+            self.flash_status(f"Y-axis range set to {y_min:.1f} - {y_max:.1f}")
             
         except ValueError:
             messagebox.showerror("Error", "Please enter valid numbers for Y-axis range")
@@ -534,40 +1409,95 @@ class PowerMonitor:
     def setup_cleanup(self):
         self.root.protocol("WM_DELETE_WINDOW", self.cleanup_and_exit)
 
+    def schedule_config_save(self):
+        """Save the configuration after CONFIG_SAVE_DELAY_MS, merging bursts of edits into one write"""
+        if not self.config_save_pending:
+            self.config_save_pending = True
+            self.root.after(CONFIG_SAVE_DELAY_MS, self.flush_config)
+
+    def flush_config(self):
+        """Hand a snapshot of the configuration to the writer thread, keeping disk I/O off the GUI thread"""
+        if self.config_save_pending:
+            self.config_save_pending = False
+            self.config_writes.put(copy.deepcopy(self.config))
+            if self.config_writer is None:
+                self.config_writer = threading.Thread(target=self.config_write_loop, daemon=True)
+                self.config_writer.start()
+
+    def config_write_loop(self):
+        while True:
+            config = self.config_writes.get()
+            # Only the newest of several queued snapshots needs writing
+            while config is not None and not self.config_writes.empty():
+                newer = self.config_writes.get()
+                if newer is None:
+                    save_config(config)
+                    return
+                config = newer
+            if config is None:
+                return
+            save_config(config)
+
     def toggle_simulation_mode(self):
         if self.simulation_mode:
             if self.connect_to_device():
+                self.initialize_continuous_measurement()
+                # A reconnect left pending by an earlier device loss would reopen this fresh session
+                with self.visa_lock:
+                    self.reconnecting = False
+                    self.reconnect_attempts = 0
                 self.simulation_mode = False
                 self.toggle_btn.config(text="Disconnect Device")
                 # Clear data when switching to real mode
-                self.data.clear()
-                messagebox.showinfo("Success", "Connected to real device!")
+                self.clear_data()
+                self.flash_status("Connected to real device")
             else:
                 messagebox.showerror("Error", "No device found. Staying in simulation mode.")
         else:
             self.simulation_mode = True
             self.device_connected = False
-            if self.n1914a:
-                self.n1914a.close()
-                self.n1914a = None
+            self.reconnecting = False
+            with self.visa_lock:
+                if self.n1914a:
+                    self.n1914a.close()
+                    self.n1914a = None
             self.toggle_btn.config(text="Connect to Device")
             # Clear data when switching to simulation mode
-            self.data.clear()
-            messagebox.showinfo("Info", "Switched to simulation mode.")
+            self.clear_data()
+            self.flash_status("Switched to simulation mode")
         self.update_status_display()
 
     def update_status_display(self):
-        if self.device_connected and not self.simulation_mode:
+        self.displayed_status = (self.device_connected, self.simulation_mode, self.reconnecting)
+        if self.reconnecting:
+            self.connection_status.config(text="Reconnecting...", foreground='#fd7e14')
+        elif self.device_connected and not self.simulation_mode:
             self.connection_status.config(text="Connected", foreground='#28a745')
         else:
             self.connection_status.config(text="Simulation mode", foreground='#dc3545')
 
     def configure_device(self):
+        """Show the configuration dialog with its fields loaded from the current configuration"""
+        if self.config_window is None:
+            self.build_config_dialog()
+        self.refresh_config_dialog()
+        self.config_window.deiconify()
+        self.config_window.lift()
+        self.config_window.grab_set()
+
+    def hide_config_dialog(self):
+        # Withdrawn rather than destroyed, so the next open does not rebuild every widget
+        self.config_window.grab_release()
+        self.config_window.withdraw()
+
+    def build_config_dialog(self):
         config_window = tk.Toplevel(self.root)
+        config_window.withdraw()  # Shown by configure_device once the fields are filled in
         config_window.title("Device Configuration")
         config_window.geometry("600x700")
         config_window.transient(self.root)
-        config_window.grab_set()
+        config_window.protocol("WM_DELETE_WINDOW", self.hide_config_dialog)
+        self.config_window = config_window
         
         # Main scrollable frame
         main_canvas = tk.Canvas(config_window)
@@ -602,6 +1532,7 @@ class PowerMonitor:
         
         device_listbox = tk.Listbox(devices_frame, height=4, exportselection=0)
         device_listbox.pack(fill=tk.X, pady=(0, 5))
+        scanned_resources = []  # Resources in listbox order, from the last scan
         
         # Scan and refresh buttons
         scan_frame = ttk.Frame(connection_frame)
@@ -609,16 +1540,12 @@ class PowerMonitor:
         
         def scan_devices():
             device_listbox.delete(0, tk.END)
+            scanned_resources.clear()
             try:
-                resources = self.rm.list_resources()
-                for i, resource in enumerate(resources):
-                    try:
-                        instrument = self.rm.open_resource(resource)
-                        identity = instrument.query("*IDN?").strip()
-                        instrument.close()
-                    except:
-                        identity = "Unknown/Error"
-                    device_listbox.insert(tk.END, f"{resource}  |  ID: {identity}")
+                resources = self.list_resources(refresh=True)
+                scanned_resources.extend(resources)
+                for resource, identity in zip(resources, self.identify_resources(resources)):
+                    device_listbox.insert(tk.END, f"{resource}  |  ID: {identity or 'Unknown/Error'}")
             except Exception as e:
                 device_listbox.insert(tk.END, f"Error scanning devices: {str(e)}")
         
@@ -628,15 +1555,13 @@ class PowerMonitor:
         manual_frame = ttk.Frame(connection_frame)
         manual_frame.pack(fill=tk.X, pady=5)
         ttk.Label(manual_frame, text="Manual Connection String:").pack(anchor=tk.W)
-        # Use the last connection string from config, or default if not available
-        last_connection = self.config["device"]["connection_string"] if self.config["device"]["connection_string"] else "USB0::0x0957::0x0607::MY12345678::INSTR"
-        manual_var = tk.StringVar(value=last_connection)
+        manual_var = tk.StringVar()
         manual_entry = ttk.Entry(manual_frame, textvariable=manual_var, width=50)
         manual_entry.pack(fill=tk.X, pady=(0, 2))
         ttk.Label(manual_frame, text="Format: USB0::ManufacturerID::ModelID::Serial::INSTR\nExample: USB0::0x0957::0x0607::MY12345678::INSTR", font=('Helvetica', 8), foreground='gray').pack(anchor=tk.W)
         
         # Connection status
-        status_var = tk.StringVar(value="Not Connected")
+        status_var = tk.StringVar()
         status_label = ttk.Label(connection_frame, textvariable=status_var, font=('Helvetica', 10, 'bold'))
         status_label.pack(pady=5)
         
@@ -646,9 +1571,8 @@ class PowerMonitor:
                 if device_listbox.curselection():
                     # Use selected device
                     selection = device_listbox.curselection()[0]
-                    resources = self.rm.list_resources()
-                    if selection < len(resources):
-                        resource = resources[selection]
+                    if selection < len(scanned_resources):
+                        resource = scanned_resources[selection]
                     else:
                         status_var.set("Error: Invalid selection")
                         return
@@ -656,7 +1580,7 @@ class PowerMonitor:
                     # Use manual entry
                     resource = manual_var.get()
                 
-                instrument = self.rm.open_resource(resource)
+                instrument = self.open_instrument(resource)
                 identity = instrument.query("*IDN?").strip()
                 instrument.close()
                 status_var.set(f"Connected: {identity}")
@@ -673,7 +1597,7 @@ class PowerMonitor:
         freq_frame = ttk.Frame(config_frame)
         freq_frame.pack(fill=tk.X, pady=5)
         ttk.Label(freq_frame, text="Frequency (Hz):", font=('Helvetica', 10, 'bold')).pack(anchor=tk.W)
-        freq_var = tk.StringVar(value=str(int(self.config["measurement"]["frequency_Hz"])))
+        freq_var = tk.StringVar()
         freq_entry = ttk.Entry(freq_frame, textvariable=freq_var, width=20)
         freq_entry.pack(anchor=tk.W, pady=(0, 5))
         ttk.Label(freq_frame, text="Range: 1 Hz to 50 GHz", font=('Helvetica', 8), foreground='gray').pack(anchor=tk.W)
@@ -682,7 +1606,7 @@ class PowerMonitor:
         avg_frame = ttk.Frame(config_frame)
         avg_frame.pack(fill=tk.X, pady=5)
         ttk.Label(avg_frame, text="Averaging Count:", font=('Helvetica', 10, 'bold')).pack(anchor=tk.W)
-        avg_var = tk.StringVar(value=str(self.config["measurement"]["averaging"]))
+        avg_var = tk.StringVar()
         avg_entry = ttk.Entry(avg_frame, textvariable=avg_var, width=20)
         avg_entry.pack(anchor=tk.W, pady=(0, 5))
         ttk.Label(avg_frame, text="Range: 1 to 1000", font=('Helvetica', 8), foreground='gray').pack(anchor=tk.W)
@@ -691,7 +1615,7 @@ class PowerMonitor:
         unit_frame = ttk.Frame(config_frame)
         unit_frame.pack(fill=tk.X, pady=5)
         ttk.Label(unit_frame, text="Measurement Unit:", font=('Helvetica', 10, 'bold')).pack(anchor=tk.W)
-        unit_var = tk.StringVar(value=self.config["measurement"]["unit"])
+        unit_var = tk.StringVar()
         unit_combo = ttk.Combobox(unit_frame, textvariable=unit_var, values=["W", "dBm", "dBW"], state="readonly", width=10)
         unit_combo.pack(anchor=tk.W, pady=(0, 5))
         
@@ -699,21 +1623,21 @@ class PowerMonitor:
         trigger_frame = ttk.Frame(config_frame)
         trigger_frame.pack(fill=tk.X, pady=5)
         ttk.Label(trigger_frame, text="Trigger Source:", font=('Helvetica', 10, 'bold')).pack(anchor=tk.W)
-        trigger_var = tk.StringVar(value=self.config["measurement"]["trigger_mode"])
+        trigger_var = tk.StringVar()
         trigger_combo = ttk.Combobox(trigger_frame, textvariable=trigger_var, values=["IMM", "EXT", "BUS"], state="readonly", width=10)
         trigger_combo.pack(anchor=tk.W, pady=(0, 5))
         
         # Auto Range
         autorange_frame = ttk.Frame(config_frame)
         autorange_frame.pack(fill=tk.X, pady=5)
-        autorange_var = tk.BooleanVar(value=self.config["measurement"]["range"] == "AUTO")
+        autorange_var = tk.BooleanVar()
         ttk.Checkbutton(autorange_frame, text="Auto Range", variable=autorange_var).pack(anchor=tk.W)
         
         # Range (if auto range is off)
         range_frame = ttk.Frame(config_frame)
         range_frame.pack(fill=tk.X, pady=5)
         ttk.Label(range_frame, text="Manual Range (W):", font=('Helvetica', 10, 'bold')).pack(anchor=tk.W)
-        range_var = tk.StringVar(value=str(self.config["measurement"]["range"]) if self.config["measurement"]["range"] != "AUTO" else "1")
+        range_var = tk.StringVar()
         range_entry = ttk.Entry(range_frame, textvariable=range_var, width=20)
         range_entry.pack(anchor=tk.W, pady=(0, 5))
         ttk.Label(range_frame, text="Range: 0.1 to 100 W", font=('Helvetica', 8), foreground='gray').pack(anchor=tk.W)
@@ -722,7 +1646,7 @@ class PowerMonitor:
         integration_frame = ttk.Frame(config_frame)
         integration_frame.pack(fill=tk.X, pady=5)
         ttk.Label(integration_frame, text="Integration Time (s):", font=('Helvetica', 10, 'bold')).pack(anchor=tk.W)
-        integration_var = tk.StringVar(value=str(self.config["measurement"]["integration_time_s"]))
+        integration_var = tk.StringVar()
         integration_entry = ttk.Entry(integration_frame, textvariable=integration_var, width=20)
         integration_entry.pack(anchor=tk.W, pady=(0, 5))
         ttk.Label(integration_frame, text="Range: 0.001 to 1.0", font=('Helvetica', 8), foreground='gray').pack(anchor=tk.W)
@@ -734,14 +1658,14 @@ class PowerMonitor:
         # API Server Enable/Disable
         api_enable_frame = ttk.Frame(api_frame)
         api_enable_frame.pack(fill=tk.X, pady=5)
-        api_enable_var = tk.BooleanVar(value=self.config["api_server"]["enabled"])
+        api_enable_var = tk.BooleanVar()
         ttk.Checkbutton(api_enable_frame, text="Enable REST API Server", variable=api_enable_var).pack(anchor=tk.W)
         
         # API Server Port
         api_port_frame = ttk.Frame(api_frame)
         api_port_frame.pack(fill=tk.X, pady=5)
         ttk.Label(api_port_frame, text="API Server Port:", font=('Helvetica', 10, 'bold')).pack(anchor=tk.W)
-        api_port_var = tk.StringVar(value=str(self.config["api_server"]["port"]))
+        api_port_var = tk.StringVar()
         api_port_entry = ttk.Entry(api_port_frame, textvariable=api_port_var, width=20)
         api_port_entry.pack(anchor=tk.W, pady=(0, 5))
         ttk.Label(api_port_frame, text="Range: 1024 to 65535", font=('Helvetica', 8), foreground='gray').pack(anchor=tk.W)
@@ -750,7 +1674,7 @@ class PowerMonitor:
         api_host_frame = ttk.Frame(api_frame)
         api_host_frame.pack(fill=tk.X, pady=5)
         ttk.Label(api_host_frame, text="API Server Host:", font=('Helvetica', 10, 'bold')).pack(anchor=tk.W)
-        api_host_var = tk.StringVar(value=self.config["api_server"]["host"])
+        api_host_var = tk.StringVar()
         api_host_entry = ttk.Entry(api_host_frame, textvariable=api_host_var, width=20)
         api_host_entry.pack(anchor=tk.W, pady=(0, 5))
         ttk.Label(api_host_frame, text="Use '0.0.0.0' for all interfaces, '127.0.0.1' for localhost only", font=('Helvetica', 8), foreground='gray').pack(anchor=tk.W)
@@ -764,20 +1688,25 @@ class PowerMonitor:
                 # Get selected device or manual entry
                 if device_listbox.curselection():
                     selection = device_listbox.curselection()[0]
-                    resources = self.rm.list_resources()
-                    if selection < len(resources):
-                        resource = resources[selection]
+                    if selection < len(scanned_resources):
+                        resource = scanned_resources[selection]
                     else:
                         messagebox.showerror("Error", "Invalid device selection")
                         return
                 else:
                     resource = manual_var.get()
                 
-                # Connect to device
-                if self.n1914a:
-                    self.n1914a.close()
-                
-                self.n1914a = self.rm.open_resource(resource)
+                # Connect to device - acquisition runs simulated until the device is configured,
+                # and any pending reconnect is dropped so a failed apply cannot leave it showing
+                with self.visa_lock:
+                    self.simulation_mode = True
+                    self.device_connected = False
+                    self.reconnecting = False
+                    self.reconnect_attempts = 0
+                    if self.n1914a:
+                        self.n1914a.close()
+                    
+                    self.n1914a = self.open_instrument(resource)
                 
                 # Apply all configurations
                 freq = float(freq_var.get())
@@ -796,33 +1725,27 @@ class PowerMonitor:
                 self.config["measurement"]["range"] = "AUTO" if autorange else str(range_val)
                 self.config["measurement"]["integration_time_s"] = integration
                 
-                # Set frequency
-                self.n1914a.write(f"SENS:FREQ {freq}")
-                
-                # Configure Channel 1 (Forward Power) - using correct SCPI commands from programming guide
-                self.n1914a.write(f"SENS1:AVER:COUN {avg_count}")
-                self.n1914a.write(f"SENS1:UNIT:POW {unit}")
-                self.n1914a.write(f"SENS1:TRIG:SOUR {trigger}")
-                if autorange:
-                    self.n1914a.write("SENS1:POW:RANG:AUTO ON")
-                else:
-                    self.n1914a.write("SENS1:POW:RANG:AUTO OFF")
-                    self.n1914a.write(f"SENS1:POW:RANG {range_val}")
-                self.n1914a.write(f"SENS1:POW:INT {integration}")
-                
-                # Configure Channel 2 (Reflected Power) - using correct SCPI commands from programming guide
-                self.n1914a.write(f"SENS2:AVER:COUN {avg_count}")
-                self.n1914a.write(f"SENS2:UNIT:POW {unit}")
-                self.n1914a.write(f"SENS2:TRIG:SOUR {trigger}")
-                if autorange:
-                    self.n1914a.write("SENS2:POW:RANG:AUTO ON")
-                else:
-                    self.n1914a.write("SENS2:POW:RANG:AUTO OFF")
-                    self.n1914a.write(f"SENS2:POW:RANG {range_val}")
-                self.n1914a.write(f"SENS2:POW:INT {integration}")
-                
-                # Test the configuration
-                identity = self.n1914a.query("*IDN?").strip()
+                # The whole batch holds visa_lock, so no other thread's SCPI traffic interleaves with it
+                with self.visa_lock:
+                    # Configure both channels (1 = forward, 2 = reflected power) with one write each
+                    # rather than one VISA transaction per setting. The leading ':' roots every
+                    # command, so none is resolved relative to the one before it in the message.
+                    for channel in (1, 2):
+                        # The frequency setting travels with the channel 1 batch
+                        commands = [f":SENS:FREQ {freq}"] if channel == 1 else []
+                        commands.append(f":SENS{channel}:AVER:COUN {avg_count}")
+                        commands.append(f":SENS{channel}:UNIT:POW {unit}")
+                        commands.append(f":SENS{channel}:TRIG:SOUR {trigger}")
+                        if autorange:
+                            commands.append(f":SENS{channel}:POW:RANG:AUTO ON")
+                        else:
+                            commands.append(f":SENS{channel}:POW:RANG:AUTO OFF")
+                            commands.append(f":SENS{channel}:POW:RANG {range_val}")
+                        commands.append(f":SENS{channel}:POW:INT {integration}")
+                        self.n1914a.write(";".join(commands))
+                    
+                    # Test the configuration
+                    identity = self.n1914a.query("*IDN?").strip()
                 
                 # Save successful connection string
                 self.config["device"]["connection_string"] = resource
@@ -865,61 +1788,100 @@ class PowerMonitor:
                         api_enable_var.set(False)
                 
                 # Save configuration
-                save_config(self.config)
+                self.schedule_config_save()
                 
                 # Update application state
                 self.device_connected = True
+                self.clear_identity_cache()
                 self.simulation_mode = False
+                self.reconnecting = False
                 self.toggle_btn.config(text="Disconnect Device")
-                self.data.clear()  # Clear data when switching to real device
+                self.clear_data()  # Clear data when switching to real device
                 self.update_status_display()
                 
                 # Initialize continuous measurement mode
                 self.initialize_continuous_measurement()
                 
-                messagebox.showinfo("Success", f"Device configured successfully!\nDevice: {identity}")
+                # The dialog's own status line and the main status bar report success without a modal
                 status_var.set(f"Connected: {identity}")
+                self.flash_status(f"Device configured successfully: {identity}")
                 
             except Exception as e:
+                if self.simulation_mode:
+                    self.toggle_btn.config(text="Connect to Device")
+                    self.update_status_display()
                 messagebox.showerror("Error", f"Failed to apply configuration: {str(e)}")
                 status_var.set(f"Configuration Failed: {str(e)}")
         
         ttk.Button(apply_frame, text="Apply Configuration", command=apply_config).pack(pady=10)
         
         # Note: Device scan is only performed when user clicks "Scan for Devices" button
+        
+        def refresh_fields():
+            # The last scan's device list is kept; only the selection is cleared, so the
+            # manual entry applies unless a device is picked again
+            device_listbox.selection_clear(0, tk.END)
+            # Use the last connection string from config, or default if not available
+            last_connection = self.config["device"]["connection_string"] if self.config["device"]["connection_string"] else "USB0::0x0957::0x0607::MY12345678::INSTR"
+            manual_var.set(last_connection)
+            status_var.set("Not Connected")
+            freq_var.set(str(int(self.config["measurement"]["frequency_Hz"])))
+            avg_var.set(str(self.config["measurement"]["averaging"]))
+            unit_var.set(self.config["measurement"]["unit"])
+            trigger_var.set(self.config["measurement"]["trigger_mode"])
+            autorange_var.set(self.config["measurement"]["range"] == "AUTO")
+            range_var.set(str(self.config["measurement"]["range"]) if self.config["measurement"]["range"] != "AUTO" else "1")
+            integration_var.set(str(self.config["measurement"]["integration_time_s"]))
+            api_enable_var.set(self.config["api_server"]["enabled"])
+            api_port_var.set(str(self.config["api_server"]["port"]))
+            api_host_var.set(self.config["api_server"]["host"])
+        
+        self.refresh_config_dialog = refresh_fields
 
     def generate_power_reading(self) -> Tuple[float, float]:
+        if not self.simulated_readings:
+            self.simulated_readings = self.simulate_power_readings(SIMULATION_BATCH_SIZE)
+        return self.simulated_readings.pop()
+
+    def simulate_power_readings(self, count: int) -> List[Tuple[float, float]]:
+        """Generate count simulated (forward, reflected) readings in one vectorized pass"""
+        uniform = self.rng.uniform
         # Generate forward power (Channel A)
-        forward_base = 800 + random.uniform(-100, 100)
-        forward_drift = random.uniform(-10, 10)
-        forward_spike = random.random() > 0.95
-        forward_noise = random.uniform(-20, 20)
-        forward_result = forward_base + forward_drift + forward_noise
-        if forward_spike:
-            forward_result *= 1.5
+        forward = 800 + uniform(-100, 100, count) + uniform(-10, 10, count) + uniform(-20, 20, count)
+        forward[self.rng.random(count) > 0.95] *= 1.5  # Occasional spikes
         
         # Generate reflected power (Channel B) - typically lower than forward
-        reflected_base = 50 + random.uniform(-20, 20)
-        reflected_drift = random.uniform(-5, 5)
-        reflected_spike = random.random() > 0.98
-        reflected_noise = random.uniform(-10, 10)
-        reflected_result = reflected_base + reflected_drift + reflected_noise
-        if reflected_spike:
-            reflected_result *= 2.0
+        reflected = 50 + uniform(-20, 20, count) + uniform(-5, 5, count) + uniform(-10, 10, count)
+        reflected[self.rng.random(count) > 0.98] *= 2.0
         
-        return (round(max(0, forward_result), 2), round(max(0, reflected_result), 2))
+        forward = np.maximum(forward, 0).round(2)
+        reflected = np.maximum(reflected, 0).round(2)
+        return list(zip(forward.tolist(), reflected.tolist()))
 
     def read_n1914a_power(self) -> Optional[Tuple[float, float]]:
-        if not self.n1914a or not self.device_connected:
-            return None
         try:
-            # Read from Channel 1 (Forward Power) - using correct SCPI commands from programming guide
-            forward_power = self.n1914a.query_ascii_values(":FETCh1:SCALar:POWer:AC?")[0]
+            with self.visa_lock:
+                # Checked and bound under the lock, so a disconnect or reconfiguration on the GUI
+                # thread cannot close or replace the session between the check and the query
+                instrument = self.n1914a
+                if not instrument or not self.device_connected:
+                    return None
+                forward_power, reflected_power = instrument.query_ascii_values(FETCH_POWER_QUERY, separator=';')
             
-            # Read from Channel 2 (Reflected Power) - using correct SCPI commands from programming guide
-            reflected_power = self.n1914a.query_ascii_values(":FETCh2:SCALar:POWer:AC?")[0]
-            
-            return (float(forward_power), float(reflected_power))
+            # query_ascii_values already converts to float
+            self.last_power = (forward_power, reflected_power)
+            self.read_timeouts = 0
+            return self.last_power
+        except pyvisa.errors.VisaIOError as e:
+            if (e.error_code == pyvisa.constants.StatusCode.error_timeout and self.last_power
+                    and self.read_timeouts < MAX_READ_TIMEOUTS):
+                # A slow measurement - keep the trace going with the last reading
+                self.read_timeouts += 1
+                print(f"Timeout reading power, reusing last reading: {e}")
+                return self.last_power
+            print(f"Error reading power: {e}")
+            self.device_connected = False
+            return None
         except Exception as e:
             print(f"Error reading power: {e}")
             self.device_connected = False
@@ -927,30 +1889,144 @@ class PowerMonitor:
 
     def start_monitoring(self):
         self.monitoring = True
+        self.stop_event.clear()
+        self.acquisition_thread = threading.Thread(target=self.acquisition_loop, daemon=True)
+        self.acquisition_thread.start()
         self.update_data()
+        self.redraw_tick()
+
+    def acquisition_loop(self):
+        """Acquire samples on a background thread and hand them to the GUI through sample_queue"""
+        # Bind the per-sample callables once instead of looking them up on every iteration
+        now = time.time
+        fromtimestamp = datetime.fromtimestamp
+        put_sample = self.sample_queue.put
+        stopped = self.stop_event.is_set
+        next_sample = now()
+        while not stopped():
+            timestamp = now()
+            if self.simulation_mode:
+                power = self.generate_power_reading()
+            elif self.reconnecting:
+                # Blocking VISA opens stay on this thread, never on the Tk loop
+                self.try_reconnect()
+                power = None
+            else:
+                was_connected = self.device_connected
+                power = self.read_n1914a_power()
+                # Only a failed read of a connected device is a lost device; a None caused by the
+                # user disconnecting or switching to simulation mid-read must not reconnect
+                if power is None and was_connected and not self.simulation_mode:
+                    # Lost the device - pause acquisition and retry the connection
+                    self.reconnect_attempts = 0
+                    self.reconnecting = True
+            if power is None:
+                wait_ms = RECONNECT_INTERVAL_MS if self.reconnecting else self.acquisition_frequency_ms
+                self.stop_event.wait(wait_ms / 1000.0)
+                next_sample = now()
+                continue
+            time_string = fromtimestamp(timestamp).strftime(TIMESTAMP_FORMAT)
+            put_sample((timestamp, power[0], power[1], time_string)) # Queue forward and reflected power
+            
+            # Keep the nominal cadence regardless of how long the read took
+            next_sample = max(next_sample + self.acquisition_frequency_ms / 1000.0, now())
+            self.stop_event.wait(next_sample - now())
 
     def update_data(self):
+        """Move queued samples into the data buffer"""
         if not self.monitoring:
             return
-        timestamp = time.time()
-        if self.simulation_mode:
-            power = self.generate_power_reading()
+        samples = []
+        while True:
+            try:
+                samples.append(self.sample_queue.get_nowait())
+            except queue.Empty:
+                break
+        if samples:
+            # Store the whole batch in one slice assignment per column
+            timestamps, forward_powers, reflected_powers, time_strings = zip(*samples)
+            records = history_records(timestamps, forward_powers, reflected_powers)
+            self.data.extend(timestamps, forward_powers, reflected_powers, time_strings, records)
+            self.data.discard_older_than(timestamps[-1] - self.time_window_s)
+            self.samples_since_plot += len(samples)
+            self.new_sample = True
+        while True:
+            try:
+                reconnected = self.reconnect_results.get_nowait()
+            except queue.Empty:
+                break
+            self.toggle_btn.config(text="Disconnect Device" if reconnected else "Connect to Device")
+        if self.displayed_status != (self.device_connected, self.simulation_mode, self.reconnecting):
+            self.update_status_display()
+        self.root.after(QUEUE_POLL_MS, self.update_data)
+
+    def try_reconnect(self):
+        """Retry the device connection from the acquisition thread, falling back to simulation
+        after MAX_RECONNECT_ATTEMPTS; the outcome is reported to the GUI through reconnect_results"""
+        # Held for the whole attempt, so a disconnect or reconfiguration from the GUI waits for
+        # it instead of racing it for self.n1914a
+        with self.visa_lock:
+            if self.n1914a:
+                try:
+                    self.n1914a.close()
+                except Exception:
+                    pass
+                self.n1914a = None
+            connected = bool(self.rm) and self.connect_to_device()
+            if not self.reconnecting or self.simulation_mode:
+                # The user disconnected while this attempt was running; drop what it opened
+                if connected:
+                    self.n1914a.close()
+                    self.n1914a = None
+                    self.device_connected = False
+                return
+        if connected:
+            print("Reconnected to device")
+            self.initialize_continuous_measurement()
+            self.read_timeouts = 0
+            self.reconnecting = False
+            self.reconnect_results.put(True)
         else:
-            power = self.read_n1914a_power()
-            if power is None:
+            self.reconnect_attempts += 1
+            if self.reconnect_attempts >= MAX_RECONNECT_ATTEMPTS:
+                print("Device not found, switching to simulation mode")
                 self.simulation_mode = True
-                power = self.generate_power_reading()
-                self.update_status_display()
-        self.data.append((timestamp, power[0], power[1])) # Append forward and reflected power
-        cutoff_time = timestamp - 60.0
-        self.data = [(t, f, r) for t, f, r in self.data if t >= cutoff_time]
-        self.update_gui()
-        self.root.after(self.acquisition_frequency_ms, self.update_data)
+                self.reconnecting = False
+                self.reconnect_results.put(False)
+
+    def redraw_tick(self):
+        """Refresh the readouts and plot at REDRAW_INTERVAL_MS, independent of the sample rate"""
+        if not self.monitoring:
+            return
+        if self.new_sample:
+            self.new_sample = False
+            self.update_readouts()
+            # While the window is minimized the plot is left alone; samples_since_plot keeps
+            # counting, so the first tick after it is shown again redraws
+            if self.samples_since_plot >= self.disp_skip and self.trend_plot.widget.winfo_viewable():
+                self.samples_since_plot = 0
+                self.update_plot()
+        self.root.after(REDRAW_INTERVAL_MS, self.redraw_tick)
+
+    def clear_data(self):
+        """Discard buffered samples, including any still waiting in the queue"""
+        while True:
+            try:
+                self.sample_queue.get_nowait()
+            except queue.Empty:
+                break
+        self.data.clear()
+        self.last_power = None
 
     def update_gui(self):
+        self.update_readouts()
+        self.update_plot()
+
+    def update_readouts(self):
+        """Show the newest sample in the forward/reflected power labels"""
         if not self.data:
             return
-        _, current_forward, current_reflected = self.data[-1]
+        _, current_forward, current_reflected = self.data.latest()
         
         # Format power values - show 0.00 instead of -0.00 for very small negative values
         forward_display = f"{current_forward:.2f} W"
@@ -958,113 +2034,75 @@ class PowerMonitor:
         
         self.forward_power_var.set(forward_display)
         self.reflected_power_var.set(reflected_display)
-        self.ax.clear()
-        timestamps = [datetime.fromtimestamp(ts) for ts, _, _ in self.data]
-        forward_powers = [f for _, f, _ in self.data]
-        reflected_powers = [r for _, _, r in self.data]
-        
-        # Plot Forward Power
-        forward_line = self.ax.plot(timestamps, forward_powers,
-                                    color='#2c7be5',
-                                    linewidth=2.5,
-                                    alpha=0.8,
-                                    marker='o',
-                                    markersize=5,
-                                    markerfacecolor='#ffffff',
-                                    markeredgecolor='#2c7be5',
-                                    markeredgewidth=1.5,
-                                    zorder=3,
-                                    label='Forward Power')[0]
-        self.ax.fill_between(timestamps, forward_powers, color='#2c7be5', alpha=0.1)
-        
-        # Plot Reflected Power
-        reflected_line = self.ax.plot(timestamps, reflected_powers,
-                                     color='#dc3545',
-                                     linewidth=2.5,
-                                     alpha=0.8,
-                                     marker='s',
-                                     markersize=5,
-                                     markerfacecolor='#ffffff',
-                                     markeredgecolor='#dc3545',
-                                     markeredgewidth=1.5,
-                                     zorder=3,
-                                     label='Reflected Power')[0]
-        self.ax.fill_between(timestamps, reflected_powers, color='#dc3545', alpha=0.1)
 
-        self.ax.set_title('Real-Time Power Measurement - Keysight N1914A',
-                          fontsize=12,
-                          fontweight='bold',
-                          pad=15,
-                          color='#343a40')
-        self.ax.set_ylabel('Watts (W)',
-                           fontsize=10,
-                           labelpad=10,
-                           color='#6c757d')
-        self.ax.set_xticks([])
-        self.ax.set_xlabel('')
-        self.ax.grid(True, linestyle=':', alpha=0.6, color='#e9ecef')
-        for spine in ['top', 'right', 'left', 'bottom']:
-            self.ax.spines[spine].set_color('#e9ecef')
-        
-        # Add legend
-        self.ax.legend(loc='upper right', framealpha=0.9, fancybox=True, shadow=True)
+    def update_plot(self):
+        if not self.data:
+            return
+        # Timestamps plot as plain epoch seconds - the x-axis has no ticks to format
+        timestamps, forward_powers, reflected_powers = self.data.snapshot()
         
         # Improved Y-axis autoscaling
+        nbins = None
         if self.auto_scale_var.get():  # Only auto-scale if enabled
-            if len(forward_powers) > 0 or len(reflected_powers) > 0:
-                # Get all power values
-                all_powers = forward_powers + reflected_powers
-                
-                if all_powers:
-                    min_power = min(all_powers)
-                    max_power = max(all_powers)
-                    power_range = max_power - min_power
-                    
-                    # Calculate intelligent padding based on power range
-                    if power_range > 0:
-                        # Use percentage-based padding for larger ranges
-                        padding_factor = 0.15  # 15% padding
-                        y_padding = max(power_range * padding_factor, 10)  # Minimum 10W padding
-                    else:
-                        # If all values are the same, add fixed padding
-                        y_padding = max(max_power * 0.1, 10)  # 10% of value or 10W minimum
-                    
-                    # Set Y-axis limits with intelligent bounds
-                    y_min = max(0, min_power - y_padding)
-                    y_max = max_power + y_padding
-                    
-                    # Ensure we have a reasonable range even for very small values
-                    if y_max - y_min < 20:
-                        y_max = y_min + 20
-                    
-                    self.ax.set_ylim(y_min, y_max)
-                    
-                    # Add Y-axis ticks with appropriate spacing
-                    if y_max - y_min > 100:
-                        # For large ranges, use fewer ticks
-                        self.ax.yaxis.set_major_locator(plt.MaxNLocator(6))
-                    else:
-                        # For smaller ranges, use more ticks
-                        self.ax.yaxis.set_major_locator(plt.MaxNLocator(8))
-            else:
-                # Default range when no data is available
-                self.ax.set_ylim(0, 1000)
+            min_power = float(min(forward_powers.min(), reflected_powers.min()))
+            max_power = float(max(forward_powers.max(), reflected_powers.max()))
+            
+            # Limits only change once the data leaves the current view, or once it fits a view
+            # less than AUTO_SCALE_SHRINK_RATIO of it (e.g. after a spike scrolled out of the window)
+            fitted = self.auto_scale_limits(min_power, max_power)
+            if (self.auto_ylim is None or min_power < self.auto_ylim[0] or max_power > self.auto_ylim[1]
+                    or fitted[1] - fitted[0] < AUTO_SCALE_SHRINK_RATIO * (self.auto_ylim[1] - self.auto_ylim[0])):
+                self.auto_ylim = fitted
+            y_min, y_max = self.auto_ylim
+            # Add Y-axis ticks with appropriate spacing: fewer ticks for large ranges
+            nbins = 6 if y_max - y_min > 100 else 8
         else:
-            # Manual scaling mode - preserve current range or use default
+            y_min, y_max = self.manual_ylim()
+        
+        # Limits above use every sample; the plot only needs as many points as it can show
+        decimate = DECIMATORS.get(self.config["display"].get("decimation"), minmax_decimate)
+        timestamps, forward_powers, reflected_powers = decimate(timestamps, forward_powers, reflected_powers)
+        
+        self.trend_plot.set_ylim(y_min, y_max, nbins)
+        self.trend_plot.set_data(timestamps, forward_powers, reflected_powers)
+
+    def manual_ylim(self) -> Tuple[float, float]:
+        """Y-axis range typed into the manual fields, or the default range if they are invalid"""
+        raw = (self.y_min_var.get(), self.y_max_var.get())
+        # Parse only when the text changed since the previous redraw
+        if raw != self.manual_ylim_cache[0]:
+            limits = (0, 1000)
             try:
-                y_min = float(self.y_min_var.get())
-                y_max = float(self.y_max_var.get())
-                if y_min < y_max and y_min >= 0:
-                    self.ax.set_ylim(y_min, y_max)
-                else:
-                    # Fallback to default range if manual values are invalid
-                    self.ax.set_ylim(0, 1000)
+                manual_min, manual_max = float(raw[0]), float(raw[1])
+                if manual_min < manual_max and manual_min >= 0:
+                    limits = (manual_min, manual_max)
             except ValueError:
-                # Fallback to default range if manual values are invalid
-                self.ax.set_ylim(0, 1000)
+                pass
+            self.manual_ylim_cache = (raw, limits)
+        return self.manual_ylim_cache[1]
+
+    @staticmethod
+    def auto_scale_limits(min_power: float, max_power: float) -> Tuple[float, float]:
+        """Padded Y-axis limits for auto-scaling"""
+        power_range = max_power - min_power
+        
+        # Calculate intelligent padding based on power range
+        if power_range > 0:
+            # Use percentage-based padding for larger ranges
+            padding_factor = 0.15  # 15% padding
+            y_padding = max(power_range * padding_factor, 10)  # Minimum 10W padding
+        else:
+            # If all values are the same, add fixed padding
+            y_padding = max(max_power * 0.1, 10)  # 10% of value or 10W minimum
         
-        self.figure.tight_layout()
-        self.canvas.draw()
+        # Set Y-axis limits with intelligent bounds
+        y_min = max(0, min_power - y_padding)
+        y_max = max_power + y_padding
+        
+        # Ensure we have a reasonable range even for very small values
+        if y_max - y_min < 20:
+            y_max = y_min + 20
+        return (y_min, y_max)
 
     def export_csv(self):
         if not self.data:
@@ -1077,25 +2115,52 @@ class PowerMonitor:
         )
         if not filename:
             return
-        try:
-            with open(filename, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Timestamp', 'Epoch Time', 'Forward Power (W)', 'Reflected Power (W)', 'Mode'])
-                for ts, f, r in self.data:
-                    mode = "Simulation" if self.simulation_mode else "Real Device"
-                    writer.writerow([
-                        datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S'),
-                        f"{ts:.3f}",
-                        f,
-                        r,
-                        mode
-                    ])
-            messagebox.showinfo("Success", f"Data exported to {filename}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to export: {str(e)}")
+        mode = "Simulation" if self.simulation_mode else "Real Device"
+        # Copy the samples here; formatting and disk I/O run on a worker so Tk stays responsive
+        columns = self.data.export_columns()
+        errors = []
+        
+        def write():
+            try:
+                self.write_csv(filename, columns, mode)
+            except Exception as e:
+                errors.append(e)
+        
+        # Not a daemon thread, so closing the window cannot cut an export short
+        export_thread = threading.Thread(target=write)
+        export_thread.start()
+        self.poll_export(export_thread, filename, errors)
+
+    def poll_export(self, export_thread, filename, errors):
+        """Report the result of a CSV export once its worker thread has finished"""
+        if export_thread.is_alive():
+            self.root.after(QUEUE_POLL_MS, self.poll_export, export_thread, filename, errors)
+        elif errors:
+            messagebox.showerror("Error", f"Failed to export: {str(errors[0])}")
+        else:
+            self.flash_status(f"Data exported to {filename}")
+
+    @staticmethod
+    def write_csv(filename, columns, mode):
+        time_strings, timestamps, forward_powers, reflected_powers = (column.tolist() for column in columns)
+        with open(filename, 'w', newline='', buffering=1 << 16) as f:
+            writer = csv.writer(f)
+            writer.writerow(['Timestamp', 'Epoch Time', 'Forward Power (W)', 'Reflected Power (W)', 'Mode'])
+            writer.writerows(
+                (time_string, f"{ts:.3f}", forward, reflected, mode)
+                for time_string, ts, forward, reflected
+                in zip(time_strings, timestamps, forward_powers, reflected_powers)
+            )
 
     def cleanup_and_exit(self):
         self.monitoring = False
+        self.stop_event.set()
+        if self.acquisition_thread:
+            self.acquisition_thread.join(timeout=2.0)
+        self.flush_config()  # Write any save still waiting on its delay
+        if self.config_writer:
+            self.config_writes.put(None)
+            self.config_writer.join(timeout=2.0)
         self.stop_api_server()  # Stop API server
         if self.n1914a:
             try:
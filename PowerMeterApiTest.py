@@ -5,18 +5,28 @@ Connects to the PowerMeter REST API and displays real-time power readings.
 """
 
 import requests
-import time
-import json
+import orjson
 import sys
+import threading
 from datetime import datetime
 import signal
 
+# Longest wait between retries while the server keeps failing
+MAX_RETRY_DELAY_S = 30
+# /api/stream (connect, read) timeouts; the read timeout must outlast the server's 15 s keepalive
+STREAM_TIMEOUT_S = (5, 30)
+
 class PowerMeterApiTest:
-    def __init__(self, base_url="http://localhost:5000"):
+    def __init__(self, base_url="http://localhost:5000", poll=False):
         self.base_url = base_url
+        self.poll = poll  # Poll /api/current instead of reading the /api/stream push feed
         self.running = True
+        self.stop_event = threading.Event()  # Set on Ctrl+C, so retry waits end immediately
         self.session = requests.Session()
         self.session.timeout = 5
+        # Last /api/current reading and its ETag; the server answers 304 while it is unchanged
+        self.current_etag = None
+        self.current_power = None
         
         # Setup signal handler for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -25,6 +35,7 @@ class PowerMeterApiTest:
         """Handle Ctrl+C gracefully"""
         print("\n\nShutting down...")
         self.running = False
+        self.stop_event.set()
         
     def test_connection(self):
         """Test if the API server is reachable"""
@@ -48,7 +59,7 @@ class PowerMeterApiTest:
         try:
             response = self.session.get(f"{self.base_url}/api/status")
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 print(f"Failed to get status: {response.status_code}")
                 return None
@@ -61,7 +72,7 @@ class PowerMeterApiTest:
         try:
             response = self.session.get(f"{self.base_url}/api/devices")
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 print(f"Failed to get devices: {response.status_code}")
                 return None
@@ -72,9 +83,14 @@ class PowerMeterApiTest:
     def get_current_power(self):
         """Get current power readings"""
         try:
-            response = self.session.get(f"{self.base_url}/api/current")
+            headers = {'If-None-Match': self.current_etag} if self.current_etag else None
+            response = self.session.get(f"{self.base_url}/api/current", headers=headers)
+            if response.status_code == 304:
+                return self.current_power
             if response.status_code == 200:
-                return response.json()
+                self.current_etag = response.headers.get('ETag')
+                self.current_power = orjson.loads(response.content)
+                return self.current_power
             else:
                 print(f"Failed to get current power: {response.status_code}")
                 return None
@@ -82,6 +98,18 @@ class PowerMeterApiTest:
             print(f"Error getting current power: {e}")
             return None
     
+    def stream_power(self):
+        """Yield power readings pushed by /api/stream as they are acquired"""
+        # The server sends a keepalive comment at least every 15 s, so a stream silent for
+        # longer than the read timeout is dead; keepalives also let stop_event end the loop
+        with self.session.get(f"{self.base_url}/api/stream", stream=True, timeout=STREAM_TIMEOUT_S) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if self.stop_event.is_set():
+                    return
+                if line.startswith(b"data: "):
+                    yield orjson.loads(line[6:])
+    
     def display_status(self, status):
         """Display server status information"""
         print("\n" + "="*60)
@@ -177,18 +205,34 @@ class PowerMeterApiTest:
         print("Format: [Time] Forward: XXX.XX W | Reflected: XXX.XX W | VSWR: X.XX")
         print("-" * 80)
         
-        # Start monitoring loop
+        # Start monitoring loop; retries back off exponentially while the server keeps failing
+        retry_delay = 1
         while self.running:
             try:
-                power_data = self.get_current_power()
-                self.display_power_reading(power_data)
-                time.sleep(1)
-                        
+                if self.poll:
+                    power_data = self.get_current_power()
+                    self.display_power_reading(power_data)
+                    retry_delay = 1 if power_data else min(retry_delay * 2, MAX_RETRY_DELAY_S)
+                    self.stop_event.wait(retry_delay)
+                else:
+                    # Readings arrive as fast as the meter is sampled; any reading resets the backoff,
+                    # so a stream that ends or drops after delivering data is retried after 1 s
+                    for power_data in self.stream_power():
+                        retry_delay = 1
+                        self.display_power_reading(power_data)
+                    self.stop_event.wait(retry_delay)
+                    retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY_S)
+                    
             except KeyboardInterrupt:
                 break
+            except requests.exceptions.HTTPError as e:
+                # Servers without /api/stream still answer /api/current
+                print(f"\nStreaming unavailable ({e}), falling back to polling")
+                self.poll = True
             except Exception as e:
-                print(f"\nError in monitoring loop: {e}")
-                time.sleep(1)
+                print(f"\nError in monitoring loop: {e} (retrying in {retry_delay} s)")
+                self.stop_event.wait(retry_delay)
+                retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY_S)
         
         print("\n\nTest completed.")
 
@@ -198,10 +242,12 @@ def main():
     parser = argparse.ArgumentParser(description='PowerMeter API Test Client')
     parser.add_argument('--url', default='http://localhost:5000', 
                        help='API server URL (default: http://localhost:5000)')
+    parser.add_argument('--poll', action='store_true',
+                       help='Poll /api/current once per second instead of streaming /api/stream')
     
     args = parser.parse_args()
     
-    test_client = PowerMeterApiTest(args.url)
+    test_client = PowerMeterApiTest(args.url, args.poll)
     test_client.run()
 
 if __name__ == "__main__":